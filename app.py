@@ -3,19 +3,47 @@ import sys
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import QTimer
 from gui.window import App
+from core.telemetry import configure_logging
+from core.warmup import warm_up
+from config import configs
 
-if __name__ == "__main__":
+# PyInstaller --splash 빌드에서만 있는 모듈. 압축을 푸는 동안 부트로더가 띄운 스플래시를 창이 뜰 때 닫는다
+try:
+    import pyi_splash
+except ImportError:
+    pyi_splash = None
+
+
+def main(argv=None, on_shown=None):
+    """창을 띄우고 이벤트 루프를 실행합니다.
+
+    pymupdf, pypdf, pytesseract 등 무거운 모듈은 창이 뜬 뒤 백그라운드에서 불러옵니다.
+    on_shown(window)은 창을 띄운 직후 이벤트 루프에서 호출됩니다 (시작 시간 측정용).
+    """
     # Windows 작업 표시줄 아이콘 설정
     # myappid = "markruler.pdf-editor.1.0"  # 임의의 문자열 ID
     # ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-    
-    app = QApplication(sys.argv)
-    
+
+    configure_logging()
+    app = QApplication(sys.argv if argv is None else argv)
+
     # 아이콘 설정
     icon_path = Path(__file__).parent / "assets" / "icon.ico"
     app.setWindowIcon(QIcon(str(icon_path)))
-    
+
     window = App()
     window.show()
-    sys.exit(app.exec())
+    if pyi_splash is not None:
+        pyi_splash.close()
+
+    if on_shown is not None:
+        QTimer.singleShot(0, lambda: on_shown(window))
+    if configs["startup"]["warm_up"]:
+        QTimer.singleShot(configs["startup"]["warm_up_delay_ms"], warm_up)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
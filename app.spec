@@ -15,9 +15,19 @@ a = Analysis(
     optimize=0,
 )
 pyz = PYZ(a.pure)
+# --onefile 압축을 푸는 동안 표시할 부트로더 스플래시 (app.py에서 창이 뜨면 닫음)
+splash = Splash(
+    'assets\\icon.ico',
+    binaries=a.binaries,
+    datas=a.datas,
+    text_pos=None,
+    always_on_top=True,
+)
 
 exe = EXE(
     pyz,
+    splash,
+    splash.binaries,
     a.scripts,
     a.binaries,
     a.datas,
@@ -0,0 +1,72 @@
+"""벤치마크용 합성 PDF를 PyMuPDF로 생성합니다."""
+from pathlib import Path
+
+import pymupdf
+
+LINES = [
+    "The quick brown fox jumps over the lazy dog. 0123456789",
+    "다람쥐 헌 쳇바퀴에 타고파. 키스의 고유조건은 입술끼리 만나야 하고",
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+    "동해 물과 백두산이 마르고 닳도록 하느님이 보우하사 우리나라 만세",
+]
+
+FIXTURES = ("text_only", "single_image", "multi_strip", "large_scan")
+
+
+def _write_text_page(page: pymupdf.Page, page_number: int):
+    y = 72
+    for i in range(30):
+        line = f"{page_number}-{i} {LINES[i % len(LINES)]}"
+        page.insert_text((72, y), line, fontname="korea", fontsize=11)
+        y += 22
+
+
+def _scan_pixmap(page_number: int, dpi: int):
+    """텍스트 페이지를 만들어 dpi로 래스터화한 '스캔' 이미지를 반환합니다."""
+    source = pymupdf.open()
+    _write_text_page(source.new_page(), page_number)
+    pix = source[0].get_pixmap(dpi=dpi, colorspace=pymupdf.csGRAY)
+    source.close()
+    return pix
+
+
+def build_fixture(kind: str, path, pages: int = 10):
+    """kind 종류의 합성 PDF를 path에 저장합니다."""
+    doc = pymupdf.open()
+    for page_number in range(1, pages + 1):
+        page = doc.new_page()
+        if kind == "text_only":
+            _write_text_page(page, page_number)
+        elif kind == "single_image":
+            page.insert_image(page.rect, pixmap=_scan_pixmap(page_number, 300))
+        elif kind == "large_scan":
+            page.insert_image(page.rect, pixmap=_scan_pixmap(page_number, 600))
+        elif kind == "multi_strip":
+            # 스캐너가 페이지를 가로 띠 여러 개로 저장하는 경우
+            pix = _scan_pixmap(page_number, 300)
+            strips = 4
+            strip_height = pix.height // strips
+            for i in range(strips):
+                clip = pymupdf.IRect(0, i * strip_height, pix.width, (i + 1) * strip_height)
+                strip = pymupdf.Pixmap(pix, pix.width, pix.height, clip)
+                rect = pymupdf.Rect(0, page.rect.height * i / strips,
+                                    page.rect.width, page.rect.height * (i + 1) / strips)
+                page.insert_image(rect, pixmap=strip)
+        else:
+            raise ValueError(f"알 수 없는 fixture: {kind}")
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+    return Path(path)
+
+
+def build_all(directory, pages: int = 10):
+    """모든 fixture를 directory에 만들고 {kind: path}를 반환합니다. 이미 있으면 재사용합니다."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for kind in FIXTURES:
+        path = directory / f"{kind}_{pages}p.pdf"
+        if not path.exists():
+            build_fixture(kind, path, pages)
+        paths[kind] = path
+    return paths
@@ -0,0 +1,201 @@
+"""OCR 파이프라인 처리량 벤치마크.
+
+    python -m benchmarks.ocr_bench --workers 1 2 4 --backends pytesseract tesserocr
+    python -m benchmarks.ocr_bench --compare bench_results_old.json
+
+합성 fixture PDF(텍스트 전용, 단일 이미지, 가로 띠 이미지, 600 DPI 스캔)를 만들고
+max_workers/백엔드 조합마다 pages/s, 페이지 지연 시간 p50/p95, 최대 RSS, 단계별 시간을 측정해
+JSON으로 저장합니다. 각 조합은 별도 프로세스에서 실행해 RSS가 섞이지 않게 합니다.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from core.ocr import OCRPipeline
+from .fixtures import FIXTURES, build_all
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_mb():
+    """(현재 프로세스, 자식 프로세스 중 최대) RSS를 MB로 반환합니다."""
+    if resource is None:
+        return None, None
+    # Linux는 KB, macOS는 바이트 단위
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / unit
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / unit
+    return round(self_rss, 1), round(children_rss, 1)
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def run_case(fixture, path, backend, max_workers, preprocess, options):
+    """조합 하나를 실행합니다. 별도 프로세스에서 호출됩니다."""
+    pipeline = OCRPipeline(path, lang=options["lang"], max_workers=max_workers,
+                           use_cache=options["cache"], backend=backend,
+                           detect_language=options["detect_language"])
+    if options["mode"]:
+        pipeline.mode = options["mode"]
+    pipeline.skip_text_layer = options["skip_text_layer"]
+    pipeline.filter_pages = options["page_filter"]
+    pipeline.preprocess = preprocess
+    pipeline.index_results = False
+
+    started = time.perf_counter()
+    results = list(pipeline.run())
+    seconds = time.perf_counter() - started
+
+    stages = {}
+    latencies = []
+    for result in results:
+        for stage, value in result.timings.items():
+            stages[stage] = stages.get(stage, 0.0) + value
+        latencies.append(sum(result.timings.values()))
+
+    rss, children_rss = peak_rss_mb()
+    pages = len(results)
+    return {
+        "fixture": fixture,
+        "backend": pipeline.engine_class.name,
+        "max_workers": max_workers,
+        "preprocess": preprocess,
+        "pages": pages,
+        "seconds": round(seconds, 4),
+        "pages_per_sec": round(pages / seconds, 3) if seconds else 0.0,
+        "latency_p50": round(percentile(latencies, 50), 4),
+        "latency_p95": round(percentile(latencies, 95), 4),
+        "peak_rss_mb": rss,
+        "peak_child_rss_mb": children_rss,
+        "blank_pages": pipeline.blank_pages,
+        "duplicate_pages": pipeline.duplicate_pages,
+        # 페이지당 평균 단계별 시간(초)
+        "stages": {stage: round(value / pages, 4) for stage, value in stages.items()},
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def case_key(case):
+    return case["fixture"], case["backend"], case["max_workers"], case.get("preprocess", False)
+
+
+def print_table(cases, baseline=None):
+    baseline = {case_key(case): case for case in (baseline or [])}
+    print(f"{'fixture':<14}{'backend':<13}{'workers':>8}{'pre':>5}{'pages/s':>10}{'p50':>9}{'p95':>9}"
+          f"{'rss MB':>9}  stages (s/page)")
+    for case in cases:
+        line = (f"{case['fixture']:<14}{case['backend']:<13}{case['max_workers']:>8}"
+                f"{'on' if case.get('preprocess') else 'off':>5}"
+                f"{case['pages_per_sec']:>10.2f}{case['latency_p50']:>9.3f}{case['latency_p95']:>9.3f}"
+                f"{case['peak_rss_mb'] or 0:>9.1f}  "
+                + ", ".join(f"{k}={v:.3f}" for k, v in case["stages"].items()))
+        old = baseline.get(case_key(case))
+        if old and old["pages_per_sec"]:
+            change = (case["pages_per_sec"] / old["pages_per_sec"] - 1) * 100
+            line += f"  ({change:+.1f}% pages/s)"
+        print(line)
+
+
+def print_preprocess_savings(cases):
+    """같은 조합의 전처리 off/on 결과로 페이지당 절약 시간을 출력합니다."""
+    by_key = {case_key(case): case for case in cases}
+    for key, on in by_key.items():
+        if not key[3]:
+            continue
+        off = by_key.get(key[:3] + (False,))
+        if off is None or not on["pages"]:
+            continue
+        saved = off["seconds"] / off["pages"] - on["seconds"] / on["pages"]
+        ocr_saved = off["stages"].get("ocr", 0) - on["stages"].get("ocr", 0)
+        print(f"전처리 {key[0]} / {key[1]} / workers={key[2]}: 페이지당 {saved:+.3f}s 절약 "
+              f"(Tesseract {ocr_saved:+.3f}s, 전처리 비용 {on['stages'].get('preprocess', 0):.3f}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.ocr_bench",
+                                     description="OCR 파이프라인 처리량 벤치마크")
+    parser.add_argument("--fixtures", nargs="+", choices=FIXTURES, default=list(FIXTURES))
+    parser.add_argument("--pages", type=int, default=10, help="fixture당 페이지 수")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--backends", nargs="+", default=["pytesseract"],
+                        help="pytesseract, tesserocr, auto")
+    parser.add_argument("--preprocess", nargs="+", choices=["off", "on"], default=["off"],
+                        help="전처리 사용 여부 (off on을 함께 주면 페이지당 절약 시간 비교)")
+    parser.add_argument("--mode", choices=["images", "render", "auto"], default=None,
+                        help="[ocr] mode 덮어쓰기")
+    parser.add_argument("--lang", default="eng+kor")
+    parser.add_argument("--detect-language", action="store_true",
+                        help="페이지별 OSD 언어 감지 사용 (기본: 모든 페이지에 --lang)")
+    parser.add_argument("--cache", action="store_true", help="OCR 캐시 사용 (기본: 사용 안 함)")
+    parser.add_argument("--no-skip-text-layer", dest="skip_text_layer", action="store_false",
+                        help="텍스트 레이어 페이지도 OCR")
+    parser.add_argument("--no-page-filter", dest="page_filter", action="store_false",
+                        help="빈/중복 페이지도 OCR")
+    parser.add_argument("--fixture-dir", default=str(Path(__file__).parent / "fixtures_cache"))
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args(argv)
+
+    paths = build_all(args.fixture_dir, args.pages)
+    options = {"lang": args.lang, "cache": args.cache, "mode": args.mode,
+               "skip_text_layer": args.skip_text_layer, "page_filter": args.page_filter,
+               "detect_language": args.detect_language}
+
+    cases = []
+    for fixture in args.fixtures:
+        for backend in args.backends:
+            for max_workers in args.workers:
+                for preprocess in args.preprocess:
+                    with ProcessPoolExecutor(max_workers=1) as pool:
+                        case = pool.submit(run_case, fixture, str(paths[fixture]), backend,
+                                           max_workers, preprocess == "on", options).result()
+                    cases.append(case)
+                    print(f"{fixture} / {case['backend']} / workers={max_workers} / "
+                          f"preprocess={preprocess}: {case['pages_per_sec']:.2f} pages/s",
+                          file=sys.stderr)
+
+    report = {
+        "commit": git_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "options": options,
+        "results": cases,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    print_table(cases, baseline)
+    print_preprocess_savings(cases)
+    print(f"결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
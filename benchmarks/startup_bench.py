@@ -0,0 +1,90 @@
+"""GUI 시작 시간(time-to-first-window) 측정과 회귀 확인.
+
+    python -m benchmarks.startup_bench
+    python -m benchmarks.startup_bench --runs 10 --budget-ms 1500
+
+app.py를 새 프로세스로 여러 번 실행해 프로세스 시작부터 첫 창이 뜰 때까지 걸린 시간을 잽니다.
+중앙값이 --budget-ms를 넘거나, 창이 뜨기 전에 무거운 모듈(pymupdf, pypdf, pytesseract,
+PIL, numpy)이 불러와졌으면 종료 코드 1을 반환하므로 CI나 빌드 전에 실행해 회귀를 막을 수 있습니다.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# 창이 뜨기 전에 불러오면 안 되는 모듈 (core.warmup이 창이 뜬 뒤 불러옴)
+HEAVY_MODULES = ("pymupdf", "pypdf", "pytesseract", "PIL", "numpy")
+
+# 자식 프로세스: 창이 뜨면 시각과 이미 불러온 무거운 모듈을 출력하고 종료
+_PROBE = f"""
+import json, sys, time
+sys.path.insert(0, {str(ROOT)!r})
+import app
+
+def shown(window):
+    print(json.dumps({{"shown": time.time(),
+                      "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}), flush=True)
+    window.close()
+    app.QApplication.instance().quit()
+
+sys.exit(app.main([sys.argv[0]], on_shown=shown))
+"""
+
+
+def measure_once(timeout=60):
+    """(시작부터 첫 창까지 초, 창이 뜨기 전에 불러온 무거운 모듈 목록)."""
+    started = time.time()
+    proc = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True,
+                          timeout=timeout, cwd=ROOT, env=os.environ.copy())
+    for line in proc.stdout.splitlines():
+        if line.startswith("{"):
+            probe = json.loads(line)
+            return probe["shown"] - started, probe["loaded"]
+    raise RuntimeError(f"창이 뜨지 않았습니다 (exit {proc.returncode}):\n{proc.stderr}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500,
+                        help="시작 시간 중앙값 상한 (밀리초)")
+    parser.add_argument("-o", "--output", default=None, help="결과를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    # 첫 실행은 .pyc 생성과 디스크 캐시 때문에 느리므로 버린다
+    measure_once()
+    seconds, loaded = [], set()
+    for _ in range(args.runs):
+        elapsed, modules = measure_once()
+        seconds.append(elapsed)
+        loaded.update(modules)
+
+    median_ms = statistics.median(seconds) * 1000
+    print(f"time-to-first-window: median {median_ms:.0f} ms, "
+          f"min {min(seconds) * 1000:.0f} ms, max {max(seconds) * 1000:.0f} ms "
+          f"({args.runs} runs, budget {args.budget_ms:.0f} ms)")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "median_ms": median_ms,
+                       "runs_ms": [s * 1000 for s in seconds], "loaded": sorted(loaded)},
+                      f, ensure_ascii=False, indent=2)
+
+    failed = False
+    if loaded:
+        print(f"[실패] 창이 뜨기 전에 불러온 무거운 모듈: {', '.join(sorted(loaded))}")
+        failed = True
+    if median_ms > args.budget_ms:
+        print(f"[실패] 시작 시간이 상한을 넘었습니다: {median_ms:.0f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
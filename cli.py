@@ -0,0 +1,239 @@
+"""PDF Editor 명령줄 도구 (Qt 없이 동작).
+
+    python -m cli ocr scans/ book.pdf -o out/ --jobs 4 --workers 4
+    python -m cli search "검색어"
+    python -m cli split book.pdf -o chapters/
+    python -m cli merge a.pdf b.pdf scans/ -o merged.pdf
+    python -m cli extract book.pdf 1-10,15 -o excerpt.pdf
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from config import configs
+from core.documents import open_document
+from core.ocr import OCRPipeline
+from core.pages import split_pdf, merge_pdfs, extract_pages, parse_ranges
+from core.search import SearchIndex
+
+
+def collect_pdfs(paths):
+    """파일/폴더 인자를 (PDF 경로, 출력 상대 경로) 목록으로 펼칩니다."""
+    documents = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            for pdf in sorted(path.rglob("*.pdf")):
+                documents.append((pdf, pdf.relative_to(path)))
+        elif path.suffix.lower() == ".pdf":
+            documents.append((path, Path(path.name)))
+        else:
+            print(f"PDF가 아니므로 건너뜀: {path}", file=sys.stderr)
+    return documents
+
+
+def ocr_document(path, output_base, first_page, last_page, lang, tesseract_path, max_workers,
+                 searchable=False, resume=False):
+    """문서 하나를 OCR 해서 .txt/.json(과 검색 가능한 .pdf)으로 저장합니다. 별도 프로세스에서 실행됩니다."""
+    started = time.perf_counter()
+    output_base = Path(output_base)
+    output_base.parent.mkdir(parents=True, exist_ok=True)
+    # --lang를 지정하면 모든 페이지에 그 언어를 사용하고, 아니면 페이지별로 감지
+    pipeline = OCRPipeline(path, first_page, last_page, lang=lang,
+                           detect_language=False if lang else None,
+                           tesseract_path=tesseract_path, max_workers=max_workers,
+                           searchable_output=output_base.with_suffix(".pdf") if searchable else None,
+                           resume=resume)
+    pages = [{"page": result.page, "text": result.text, "source": result.source,
+              "lang": result.lang, "script": result.script}
+             for result in pipeline.run()]
+    seconds = time.perf_counter() - started
+
+    with open(output_base.with_suffix(".txt"), "w", encoding="utf-8") as f:
+        for page in pages:
+            if page["text"]:
+                f.write(f"=== Page {page['page']} ===\n{page['text']}\n\n")
+    with open(output_base.with_suffix(".json"), "w", encoding="utf-8") as f:
+        json.dump({"source": str(path), "lang": pipeline.lang, "seconds": seconds, "pages": pages},
+                  f, ensure_ascii=False, indent=2)
+
+    return {"source": str(path), "pages": len(pages), "seconds": seconds,
+            "text_layer_pages": pipeline.text_layer_pages, "blank_pages": pipeline.blank_pages,
+            "duplicate_pages": pipeline.duplicate_pages, "saved_seconds": pipeline.saved_seconds}
+
+
+def cmd_ocr(args):
+    documents = collect_pdfs(args.paths)
+    if not documents:
+        print("처리할 PDF가 없습니다.", file=sys.stderr)
+        return 1
+
+    output_dir = Path(args.output)
+    started = time.perf_counter()
+    total_pages = 0
+    text_layer_pages = 0
+    skipped_pages = 0  # 빈 페이지 + 중복 페이지
+    saved_seconds = 0.0
+    failed = 0
+
+    # 파일 단위는 프로세스 풀로, 페이지 단위는 각 프로세스의 OCRPipeline 스레드 풀로 병렬 처리
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {
+            pool.submit(ocr_document, path, output_dir / rel, args.first, args.last,
+                        args.lang, args.tesseract, args.workers, args.searchable,
+                        args.resume): path
+            for path, rel in documents
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[실패] {path}: {e}", file=sys.stderr)
+                continue
+            total_pages += summary["pages"]
+            text_layer_pages += summary["text_layer_pages"]
+            skipped_pages += summary["blank_pages"] + summary["duplicate_pages"]
+            saved_seconds += summary["saved_seconds"]
+            print(f"[완료] {path}: {summary['pages']} pages "
+                  f"(텍스트 레이어 {summary['text_layer_pages']}, 빈 페이지 {summary['blank_pages']}, "
+                  f"중복 {summary['duplicate_pages']}), {summary['seconds']:.1f}s "
+                  f"({summary['pages'] / max(summary['seconds'], 1e-9):.2f} pages/s)")
+
+    elapsed = time.perf_counter() - started
+    print(f"총 {len(documents) - failed}/{len(documents)} 문서, {total_pages} 페이지 "
+          f"(텍스트 레이어 {text_layer_pages}, 빈/중복 건너뜀 {skipped_pages}, "
+          f"약 {saved_seconds:.1f}s 절약), "
+          f"{elapsed:.1f}s, {total_pages / max(elapsed, 1e-9):.2f} pages/s")
+    return 1 if failed else 0
+
+
+def cmd_search(args):
+    index = SearchIndex(args.index)
+    try:
+        started = time.perf_counter()
+        hits = index.search(args.query, limit=args.limit)
+        elapsed = time.perf_counter() - started
+        for hit in hits:
+            print(f"{hit.path}:{hit.page}: {hit.snippet}")
+        documents, pages = index.stats()
+    finally:
+        index.close()
+    print(f"{len(hits)}건 ({documents} 문서 / {pages} 페이지 중, {elapsed * 1000:.1f}ms)",
+          file=sys.stderr)
+    return 0 if hits else 1
+
+
+def _print_progress(done, total):
+    print(f"\r{done}/{total}", end="" if done < total else "\n", file=sys.stderr, flush=True)
+
+
+def cmd_split(args):
+    started = time.perf_counter()
+    try:
+        ranges = None
+        if args.ranges:
+            ranges = parse_ranges(args.ranges, open_document(args.path).page_count)
+        if args.output:
+            Path(args.output).mkdir(parents=True, exist_ok=True)
+        outputs = split_pdf(args.path, ranges, args.output, on_progress=_print_progress)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    for output in outputs:
+        print(output)
+    print(f"{len(outputs)}개 파일, {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+def cmd_merge(args):
+    paths = [path for path, _ in collect_pdfs(args.paths)]
+    if len(paths) < 2:
+        print("합칠 PDF가 두 개 이상 필요합니다.", file=sys.stderr)
+        return 1
+    started = time.perf_counter()
+    try:
+        merge_pdfs(paths, args.output, args.file_bookmarks, on_progress=_print_progress)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(f"{len(paths)}개 파일 → {args.output}, {time.perf_counter() - started:.1f}s",
+          file=sys.stderr)
+    return 0
+
+
+def cmd_extract(args):
+    try:
+        ranges = parse_ranges(args.ranges, open_document(args.path).page_count)
+        extract_pages(args.path, ranges, args.output)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    print(args.output)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m cli", description="PDF Editor 명령줄 도구")
+    parser.add_argument("-v", "--verbose", action="store_true", help="진행 로그 출력")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ocr = subparsers.add_parser("ocr", help="PDF 파일/폴더를 OCR 해서 텍스트로 저장")
+    ocr.add_argument("paths", nargs="+", help="PDF 파일 또는 PDF가 들어 있는 폴더")
+    ocr.add_argument("-o", "--output", default="ocr_output", help="출력 폴더")
+    ocr.add_argument("--first", type=int, default=1, help="첫 페이지 (기본: 1)")
+    ocr.add_argument("--last", type=int, default=None, help="마지막 페이지 (기본: 끝)")
+    ocr.add_argument("--lang", help="Tesseract 언어 코드. 지정하면 페이지별 언어 감지를 사용하지 않음"
+                                    " (기본: configs.toml [languages])")
+    ocr.add_argument("--tesseract", default=None, help="Tesseract 실행 파일 경로")
+    ocr.add_argument("-j", "--jobs", type=int, default=1, help="동시에 처리할 문서 수 (프로세스)")
+    ocr.add_argument("-w", "--workers", type=int, default=configs["worker"]["max_workers"],
+                     help="문서당 동시에 OCR 할 페이지 수")
+    ocr.add_argument("--searchable", action="store_true",
+                     help="OCR 텍스트 레이어를 넣은 검색 가능한 PDF도 저장")
+    ocr.add_argument("--resume", action="store_true",
+                     help="중단된 작업의 체크포인트가 있으면 남은 페이지만 OCR")
+    ocr.set_defaults(func=cmd_ocr)
+
+    search = subparsers.add_parser("search", help="OCR 결과 전문 검색")
+    search.add_argument("query", help="검색어 (공백으로 나눈 각 부분을 모두 포함하는 페이지)")
+    search.add_argument("-n", "--limit", type=int, default=50, help="최대 결과 수")
+    search.add_argument("--index", default=None, help="검색 색인 파일 경로")
+    search.set_defaults(func=cmd_search)
+
+    split = subparsers.add_parser("split", help="PDF를 페이지 범위 또는 최상위 아웃라인(장)마다 나누기")
+    split.add_argument("path", help="나눌 PDF")
+    split.add_argument("-r", "--ranges", default=None,
+                       help="파일마다 나눌 페이지 범위 (예: 1-10,11-20,21-). 없으면 최상위 아웃라인 기준")
+    split.add_argument("-o", "--output", default=None, help="출력 폴더 (기본: 원본 폴더)")
+    split.set_defaults(func=cmd_split)
+
+    merge = subparsers.add_parser("merge", help="여러 PDF를 아웃라인과 함께 하나로 합치기")
+    merge.add_argument("paths", nargs="+", help="합칠 PDF 파일 또는 폴더 (순서대로)")
+    merge.add_argument("-o", "--output", required=True, help="저장할 PDF 경로")
+    merge.add_argument("--file-bookmarks", action="store_true",
+                       help="파일마다 파일 이름으로 된 최상위 아웃라인 항목 추가")
+    merge.set_defaults(func=cmd_merge)
+
+    extract = subparsers.add_parser("extract", help="페이지 범위를 새 PDF로 저장")
+    extract.add_argument("path", help="원본 PDF")
+    extract.add_argument("ranges", help="페이지 범위 (예: 1-10,15,20-)")
+    extract.add_argument("-o", "--output", required=True, help="저장할 PDF 경로")
+    extract.set_defaults(func=cmd_extract)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
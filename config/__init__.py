@@ -2,6 +2,8 @@ import tomllib
 from pathlib import Path
 
 CONFIG_PATH = Path(__file__).parent.parent / "configs.toml"
+# OCR 캐시 등 사용자별 데이터 저장 경로
+DATA_DIR = Path.home() / ".pdf-editor"
 
 def load_config():
     with open(CONFIG_PATH, "rb") as f:
@@ -1,3 +1,18 @@
-from .workers import OCRWorker
+__all__ = ['OCRPipeline', 'PageResult', 'OCRQueue', 'OCRJob', 'OCRWorker']
 
-__all__ = ['OCRWorker'] 
\ No newline at end of file
+# 모듈마다 무거운 의존성(pymupdf, PIL, pytesseract, PyQt6)이 있어 처음 사용할 때 불러옵니다.
+# GUI 시작 시간을 줄이기 위해서입니다.
+_LAZY = {
+    "OCRPipeline": ".ocr",
+    "PageResult": ".ocr",
+    "OCRQueue": ".jobs",
+    "OCRJob": ".jobs",
+    "OCRWorker": ".workers",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,108 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from config import configs, DATA_DIR
+
+
+class OCRCache:
+    """이미지 바이트 해시로 OCR 결과를 보관하는 SQLite 캐시.
+
+    키는 원본 이미지 바이트, 언어, Tesseract 버전과 설정으로 만들어지므로
+    같은 이미지를 같은 조건으로 다시 OCR 할 때만 적중합니다.
+    전체 크기가 max_size_mb를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, path=None, max_size_mb=None):
+        self.path = Path(path or configs["cache"]["path"] or DATA_DIR / "ocr_cache.sqlite3")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if max_size_mb is None:
+            max_size_mb = configs["cache"]["max_size_mb"]
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        # OSD 결과 조회는 OCR 적중률과 따로 센다
+        self.osd_hits = 0
+        self.osd_misses = 0
+
+        # 스레드 풀의 여러 스레드에서 접근하므로 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ocr_cache ("
+            " key TEXT PRIMARY KEY,"
+            " text TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " accessed REAL NOT NULL)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ocr_cache_accessed ON ocr_cache (accessed)")
+        self._conn.commit()
+        self._size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM ocr_cache").fetchone()[0]
+
+    @staticmethod
+    def make_key(image_bytes: bytes, lang: str, engine_id: str) -> str:
+        """이미지 바이트와 OCR 조건(언어, 엔진 버전/설정)으로 캐시 키를 만듭니다."""
+        digest = hashlib.sha256(image_bytes)
+        digest.update(b"\0" + lang.encode() + b"\0" + engine_id.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, osd=False):
+        """key의 결과. 없으면 None. osd이면 OSD 조회로 따로 셉니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                if osd:
+                    self.osd_misses += 1
+                else:
+                    self.misses += 1
+                return None
+            if osd:
+                self.osd_hits += 1
+            else:
+                self.hits += 1
+            self._conn.execute(
+                "UPDATE ocr_cache SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, text: str):
+        size = len(text.encode()) + len(key)
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ocr_cache (key, text, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, text, size, time.time()))
+            self._size += size - (old[0] if old else 0)
+            if self._size > self.max_size:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """최대 크기의 90% 이하가 될 때까지 오래된 항목을 제거합니다. 잠금 안에서 호출합니다."""
+        target = self.max_size * 0.9
+        rows = self._conn.execute(
+            "SELECT key, size FROM ocr_cache ORDER BY accessed")
+        evicted = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            evicted.append((key,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM ocr_cache WHERE key = ?", evicted)
+
+    def stats_message(self) -> str:
+        message = f"캐시 적중 {self.hits} / 미스 {self.misses}"
+        if self.osd_hits or self.osd_misses:
+            message += f" (OSD 적중 {self.osd_hits} / 미스 {self.osd_misses})"
+        return message
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,99 @@
+"""OCR 작업 체크포인트.
+
+완료된 페이지를 문서 지문과 페이지 범위로 정해지는 저널 파일(JSON lines)에 한 줄씩
+추가합니다. 중단되거나 비정상 종료된 작업을 같은 조건으로 다시 시작하면 남은 페이지만 OCR 합니다.
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from config import configs, DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# 지문 계산에 읽을 파일 앞/뒤 크기
+FINGERPRINT_SAMPLE = 1024 * 1024
+
+_fingerprints = {}  # (경로, 크기, 수정 시각) → 지문
+
+
+def document_fingerprint(path):
+    """파일 크기와 앞/뒤 1MB로 문서 지문을 만듭니다. 큰 스캔 PDF도 전체를 읽지 않습니다.
+
+    파일이 바뀌지 않았으면 이전에 계산한 지문을 그대로 반환합니다.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    fingerprint = _fingerprints.get(key)
+    if fingerprint is not None:
+        return fingerprint
+
+    size = stat.st_size
+    digest = hashlib.sha256(str(size).encode())
+    with open(path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE))
+        if size > FINGERPRINT_SAMPLE:
+            f.seek(max(FINGERPRINT_SAMPLE, size - FINGERPRINT_SAMPLE))
+            digest.update(f.read())
+    fingerprint = _fingerprints[key] = digest.hexdigest()
+    return fingerprint
+
+
+class OCRJournal:
+    """한 OCR 작업(문서, 페이지 범위, 언어, 출력 종류)의 완료 페이지 기록.
+
+    한 줄에 페이지 하나를 쓰고 바로 flush 하므로 프로세스가 죽어도 이미 끝난 페이지는 남습니다.
+    마지막 줄이 잘린 경우 읽을 때 무시합니다.
+    """
+
+    def __init__(self, filename, first_page, last_page, lang, words=False, directory=None):
+        self.filename = str(filename)
+        directory = Path(directory or configs["checkpoint"]["path"] or DATA_DIR / "checkpoints")
+        directory.mkdir(parents=True, exist_ok=True)
+        key = f"{document_fingerprint(filename)}|{first_page}-{last_page}|{lang}|{int(words)}"
+        name = hashlib.sha256(key.encode()).hexdigest()[:32]
+        self.path = directory / f"{name}.jsonl"
+        self._file = None
+
+    def exists(self):
+        return self.path.exists()
+
+    def load(self):
+        """저장된 페이지 기록을 {페이지 번호: dict}로 읽습니다."""
+        pages = {}
+        if not self.path.exists():
+            return pages
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 중 종료되어 잘린 줄
+                    continue
+                pages[entry["page"]] = entry
+        return pages
+
+    def completed_pages(self):
+        return len(self.load())
+
+    def append(self, result):
+        """완료된 PageResult를 기록합니다."""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        entry = {"page": result.page, "text": result.text, "source": result.source,
+                 "words": result.words, "text_angle": result.text_angle, "lang": result.lang,
+                 "script": result.script}
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """작업이 끝났거나 처음부터 다시 할 때 기록을 지웁니다."""
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,149 @@
+"""PDF 파일을 한 번만 열어 뷰어 외의 도구(OCR, 썸네일, 아웃라인)가 함께 쓰게 합니다.
+
+파일은 읽기 전용 mmap으로 매핑하고, pymupdf 핸들은 그 버퍼를 복사 없이(memoryview) 엽니다.
+페이지 수, 아웃라인처럼 파싱한 구조는 Document에 한 번만 계산해 둡니다.
+"""
+from functools import cached_property
+import gc
+import logging
+import mmap
+import os
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+class _HandleOwner:
+    """스레드 로컬에 두는 표식. 스레드가 끝나 스레드 로컬이 비워지면 그 스레드의 핸들을 닫습니다."""
+
+    def __init__(self, document, ident, doc):
+        # 핸들 자체를 잡고 있으면 mmap을 닫을 수 없으므로 id만 기억한다
+        weakref.finalize(self, document._drop_handle, ident, id(doc))
+
+
+class Document:
+    """mmap으로 연 PDF 파일 하나.
+
+    pymupdf.Document는 스레드 간에 공유할 수 없으므로 스레드마다 핸들을 따로 씁니다.
+    핸들은 같은 mmap 버퍼를 가리키므로 파일을 다시 읽거나 메모리에 복사하지 않습니다.
+    짧게 쓰고 끝나는 작업 스레드의 핸들은 스레드가 끝나면 닫힙니다.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        stat = os.stat(self.path)
+        self.signature = (stat.st_size, stat.st_mtime_ns)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._handles = {}  # 스레드 id → pymupdf.Document
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def open_handle(self):
+        """새 pymupdf 핸들을 엽니다. 호출한 쪽에서 닫아야 합니다."""
+        # pymupdf는 불러오는 데 오래 걸리므로 앱 시작 시가 아니라 처음 문서를 열 때 불러온다
+        import pymupdf
+
+        # 핸들마다 memoryview를 따로 만들어, 핸들이 남아 있으면 mmap을 닫지 못하게 한다
+        return pymupdf.open(stream=memoryview(self._mmap), filetype="pdf")
+
+    def handle(self):
+        """현재 스레드용 핸들. 스레드마다 처음 한 번만 엽니다."""
+        ident = threading.get_ident()
+        with self._lock:
+            doc = self._handles.get(ident)
+        if doc is None or doc.is_closed:
+            doc = self.open_handle()
+            with self._lock:
+                self._handles[ident] = doc
+            self._local.owner = _HandleOwner(self, ident, doc)
+        return doc
+
+    def release(self):
+        """현재 스레드의 핸들을 닫습니다."""
+        self._local.__dict__.pop("owner", None)
+        self._drop_handle(threading.get_ident())
+
+    def _drop_handle(self, ident, doc_id=None):
+        """ident 스레드의 핸들을 닫습니다. doc_id를 주면 그 핸들일 때만 (스레드 id는 재사용될 수 있음)."""
+        with self._lock:
+            doc = self._handles.get(ident)
+            if doc is None or (doc_id is not None and id(doc) != doc_id):
+                return
+            del self._handles[ident]
+        doc.close()
+
+    @cached_property
+    def page_count(self):
+        return len(self.handle())
+
+    @cached_property
+    def toc(self):
+        """아웃라인 [level, title, page] 목록. 이름 있는 대상도 페이지 번호로 풀어 둡니다."""
+        return self.handle().get_toc(simple=True)
+
+    def is_stale(self):
+        """파일이 열린 뒤 바뀌었는지 확인합니다."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return True
+        return (stat.st_size, stat.st_mtime_ns) != self.signature
+
+    def close(self):
+        with self._lock:
+            handles, self._handles = self._handles, {}
+        # 닫은 핸들도 memoryview를 들고 있으므로 닫은 뒤 참조를 버린다
+        while handles:
+            handles.popitem()[1].close()
+        try:
+            self._mmap.close()
+            return
+        except BufferError:
+            # get_toc() 등이 남긴 순환 참조가 닫힌 핸들을 붙잡고 있을 수 있다
+            gc.collect()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # 다른 곳에서 만든 핸들이 아직 버퍼를 참조 중이면 GC에 맡긴다
+            logger.debug(f"mmap이 아직 사용 중입니다: {self.path}")
+
+
+class DocumentManager:
+    """경로별로 Document를 하나만 유지합니다. 파일이 바뀌었으면 다시 엽니다."""
+
+    def __init__(self):
+        self._documents = {}
+        self._lock = threading.Lock()
+
+    def get(self, path) -> Document:
+        key = os.path.abspath(path)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is None or document.is_stale():
+                # 바뀐 파일의 이전 Document는 사용 중일 수 있으므로 닫지 않고 참조만 버림
+                document = Document(key)
+                self._documents[key] = document
+        return document
+
+    def close(self, path):
+        with self._lock:
+            document = self._documents.pop(os.path.abspath(path), None)
+        if document is not None:
+            document.close()
+
+    def close_all(self):
+        with self._lock:
+            documents = list(self._documents.values())
+            self._documents.clear()
+        for document in documents:
+            document.close()
+
+
+documents = DocumentManager()
+
+
+def open_document(path) -> Document:
+    """공유 DocumentManager에서 path의 Document를 가져옵니다."""
+    return documents.get(path)
@@ -0,0 +1,257 @@
+from pathlib import Path
+import shlex
+import string
+import subprocess
+import sys
+
+from PIL import Image
+from pytesseract import pytesseract
+
+from config import configs
+from .languages import ScriptInfo, parse_osd
+
+# tesserocr(libtesseract 바인딩)는 선택 의존성입니다.
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+def resolve_tesseract_cmd(tesseract_path=None):
+    """사용할 Tesseract 실행 파일 경로를 결정합니다.
+
+    인자 → configs의 cmd_path → default_cmd_path(존재하는 경우) → PATH의 tesseract 순서입니다.
+    """
+    if tesseract_path:
+        return tesseract_path
+    if configs["tesseract"]["cmd_path"]:
+        return configs["tesseract"]["cmd_path"]
+    if Path(configs["tesseract"]["default_cmd_path"]).exists():
+        return configs["tesseract"]["default_cmd_path"]
+    return "tesseract"
+
+
+def resolve_tessdata_path(tesseract_path=None):
+    """tessdata 폴더 경로. 설정이 없으면 실행 파일 옆의 tessdata를 찾고, 없으면 None."""
+    if configs["tesseract"]["tessdata_path"]:
+        return configs["tesseract"]["tessdata_path"]
+    tessdata = Path(resolve_tesseract_cmd(tesseract_path)).parent / "tessdata"
+    return str(tessdata) if tessdata.is_dir() else None
+
+
+class OCREngine:
+    """OCR 백엔드 공통 인터페이스.
+
+    엔진 인스턴스는 스레드 하나에서만 사용합니다. OCRPipeline은 워커 스레드마다
+    엔진을 하나씩 만들어 페이지 사이에 재사용합니다.
+    """
+    name = ""
+
+    def __init__(self, lang: str, config: str = "", tesseract_path=None):
+        self.lang = lang
+        self.config = config
+        self.tesseract_path = tesseract_path
+
+    @classmethod
+    def version(cls, tesseract_path=None) -> str:
+        raise NotImplementedError
+
+    @classmethod
+    def languages(cls, tesseract_path=None) -> list:
+        """설치된 언어 모델 목록 ("eng", "kor", "osd" 등)."""
+        raise NotImplementedError
+
+    def prepare(self, image):
+        """PageImage를 엔진 입력으로 변환(디코딩)합니다."""
+        return image.to_pil()
+
+    def recognize(self, prepared, dpi: int = 0) -> str:
+        """prepare()의 결과를 OCR 해서 원문 텍스트를 반환합니다."""
+        raise NotImplementedError
+
+    def recognize_words(self, prepared, dpi: int = 0):
+        """한 번의 OCR로 (원문 텍스트, 단어 목록)을 반환합니다.
+
+        단어는 prepare()에 넘긴 이미지의 픽셀 좌표 (x0, y0, x1, y1, text)입니다.
+        """
+        raise NotImplementedError
+
+    def detect_script(self, image) -> ScriptInfo:
+        """PIL 이미지의 방향과 문자 체계를 감지합니다. lang="osd"로 만든 엔진에서 호출합니다."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PytesseractEngine(OCREngine):
+    """이미지마다 tesseract 프로세스를 실행하는 기존 방식 (fallback).
+
+    pytesseract는 모듈 전역 tesseract_cmd로 실행하므로, 작업마다 다른 실행 파일을 쓸 수 있도록
+    임시 파일 처리만 pytesseract에 맡기고 프로세스는 엔진의 실행 파일 경로로 직접 실행합니다.
+    """
+    name = "pytesseract"
+
+    def __init__(self, lang: str, config: str = "", tesseract_path=None):
+        super().__init__(lang, config, tesseract_path)
+        self.cmd = resolve_tesseract_cmd(tesseract_path)
+
+    @classmethod
+    def version(cls, tesseract_path=None) -> str:
+        output = _run_command([resolve_tesseract_cmd(tesseract_path), "--version"])
+        # "tesseract 5.3.0" 또는 "tesseract v5.3.0.20221214" 형식
+        return output.lstrip(string.printable[10:]).split()[0].partition("-")[0]
+
+    @classmethod
+    def languages(cls, tesseract_path=None) -> list:
+        output = _run_command([resolve_tesseract_cmd(tesseract_path), "--list-langs"])
+        return [line.strip() for line in output.splitlines()
+                if pytesseract.LANG_PATTERN.match(line.strip())]
+
+    def _run(self, image, extension, lang, config):
+        """image를 tesseract로 인식하고 extension 출력 파일의 내용을 반환합니다."""
+        with pytesseract.save(image) as (temp_name, input_filename):
+            args = [self.cmd, input_filename, temp_name, "-l", lang]
+            args += shlex.split(config, posix=sys.platform != "win32")
+            if extension not in ("osd", "tsv"):
+                args.append(extension)
+            _run_command(args)
+            with open(f"{temp_name}.{extension}", "rb") as f:
+                return f.read().decode(pytesseract.DEFAULT_ENCODING)
+
+    def _config(self, dpi):
+        if dpi:
+            return f"{self.config} --dpi {dpi}".strip()
+        return self.config
+
+    def recognize(self, prepared, dpi: int = 0) -> str:
+        return self._run(prepared, "txt", self.lang, self._config(dpi))
+
+    def recognize_words(self, prepared, dpi: int = 0):
+        tsv = self._run(prepared, "tsv", self.lang,
+                        f"-c tessedit_create_tsv=1 {self._config(dpi)}".strip())
+        data = pytesseract.file_to_dict(tsv, "\t", -1)
+        words = []
+        lines = {}  # (block, par, line) → 단어들. TSV로 image_to_string과 같은 텍스트를 재구성
+        for i, word in enumerate(data["text"]):
+            if not word or not word.strip():
+                continue
+            left, top = data["left"][i], data["top"][i]
+            words.append((left, top, left + data["width"][i], top + data["height"][i], word))
+            key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+            lines.setdefault(key, []).append(word)
+
+        text = ""
+        previous_block = None
+        for (block, par, line), line_words in lines.items():
+            if previous_block is not None and block != previous_block:
+                text += "\n"
+            text += " ".join(line_words) + "\n"
+            previous_block = block
+        return text, words
+
+    def detect_script(self, image) -> ScriptInfo:
+        return parse_osd(self._run(image, "osd", "osd", f"--psm 0 {self.config}".strip()))
+
+
+def _run_command(args):
+    """tesseract를 실행하고 표준 출력을 반환합니다. 오류는 pytesseract와 같은 예외로 알립니다."""
+    try:
+        # subprocess_args()는 Windows에서 콘솔 창이 뜨지 않게 한다
+        process = subprocess.Popen(args, **pytesseract.subprocess_args())
+    except OSError:
+        raise pytesseract.TesseractNotFoundError()
+    stdout, stderr = process.communicate()
+    # --list-langs는 tesseract 3.x에서 1을 반환한다
+    if process.returncode and not (process.returncode == 1 and "--list-langs" in args):
+        raise pytesseract.TesseractError(process.returncode, pytesseract.get_errors(stderr))
+    # --version, --list-langs는 버전에 따라 stderr로 출력한다
+    return (stdout + stderr).decode(pytesseract.DEFAULT_ENCODING)
+
+
+class TesserocrEngine(OCREngine):
+    """libtesseract를 프로세스 안에서 직접 사용하는 엔진.
+
+    언어 모델은 엔진을 만들 때 한 번만 읽고, 이미지는 임시 파일 없이 메모리로 전달합니다.
+    """
+    name = "tesserocr"
+
+    def __init__(self, lang: str, config: str = "", tesseract_path=None):
+        super().__init__(lang, config, tesseract_path)
+        kwargs = {"lang": lang}
+        if lang == "osd":
+            kwargs["psm"] = tesserocr.PSM.OSD_ONLY
+        tessdata = resolve_tessdata_path(tesseract_path)
+        if tessdata:
+            kwargs["path"] = tessdata
+        self.api = tesserocr.PyTessBaseAPI(**kwargs)
+
+    @classmethod
+    def version(cls, tesseract_path=None) -> str:
+        # "tesseract 5.3.0\n leptonica-..." 형식에서 버전만 사용
+        return tesserocr.tesseract_version().split()[1]
+
+    @classmethod
+    def languages(cls, tesseract_path=None) -> list:
+        tessdata = resolve_tessdata_path(tesseract_path)
+        return tesserocr.get_languages(tessdata)[1] if tessdata else tesserocr.get_languages()[1]
+
+    def prepare(self, image):
+        # 렌더링된 픽스맵 버퍼는 디코딩 없이 그대로 전달
+        return image if image.mode else image.to_pil()
+
+    def _set_image(self, prepared, dpi):
+        if isinstance(prepared, Image.Image):
+            self.api.SetImage(prepared)
+        else:
+            bytes_per_pixel = len(prepared.mode)
+            self.api.SetImageBytes(prepared.data, prepared.width, prepared.height,
+                                   bytes_per_pixel, prepared.width * bytes_per_pixel)
+        if dpi:
+            self.api.SetSourceResolution(dpi)
+
+    def recognize(self, prepared, dpi: int = 0) -> str:
+        self._set_image(prepared, dpi)
+        return self.api.GetUTF8Text()
+
+    def recognize_words(self, prepared, dpi: int = 0):
+        self._set_image(prepared, dpi)
+        self.api.Recognize()
+        text = self.api.GetUTF8Text()
+        words = []
+        level = tesserocr.RIL.WORD
+        for word in tesserocr.iterate_level(self.api.GetIterator(), level):
+            word_text = word.GetUTF8Text(level)
+            box = word.BoundingBox(level)
+            if word_text and box:
+                words.append((*box, word_text))
+        return text, words
+
+    def detect_script(self, image) -> ScriptInfo:
+        self.api.SetImage(image)
+        osd = self.api.DetectOrientationScript()
+        if not osd:
+            return ScriptInfo()
+        return ScriptInfo(osd["script_name"], osd["script_conf"],
+                          osd["orient_deg"], osd["orient_conf"])
+
+    def close(self):
+        self.api.End()
+
+
+ENGINES = {
+    PytesseractEngine.name: PytesseractEngine,
+    TesserocrEngine.name: TesserocrEngine,
+}
+
+
+def get_engine_class(backend=None):
+    """설정된 백엔드의 엔진 클래스를 반환합니다. auto는 tesserocr가 있으면 사용합니다."""
+    backend = backend or configs["ocr"]["backend"]
+    if backend == "auto":
+        backend = TesserocrEngine.name if tesserocr is not None else PytesseractEngine.name
+    if backend not in ENGINES:
+        raise ValueError(f"알 수 없는 OCR 백엔드: {backend}")
+    if backend == TesserocrEngine.name and tesserocr is None:
+        raise RuntimeError("tesserocr 패키지가 설치되어 있지 않습니다. backend를 pytesseract로 설정하세요.")
+    return ENGINES[backend]
@@ -0,0 +1,255 @@
+"""여러 PDF의 OCR 작업 대기열.
+
+모든 작업은 우선순위가 있는 하나의 페이지 단위 스레드 풀(PriorityExecutor)을 나눠 씁니다.
+동시에 max_active_jobs개의 작업이 페이지를 추출/제출하므로, 한 파일의 마지막 페이지들을
+OCR 하는 동안 다음 파일의 페이지가 이미 대기열에 들어가 있어 파일 사이에 풀이 놀지 않습니다.
+"""
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import heapq
+import itertools
+import logging
+import os
+import threading
+
+from config import configs
+from .documents import open_document
+
+logger = logging.getLogger(__name__)
+
+# 작을수록 먼저 처리
+PRIORITY_INTERACTIVE = -20  # GUI에서 바로 실행한 OCR
+PRIORITY_VIEWED = -10  # 사용자가 보고 있는 문서
+PRIORITY_NORMAL = 0
+
+WAITING = "waiting"
+RUNNING = "running"
+PAUSED = "paused"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+
+class PriorityExecutor:
+    """priority가 작은 작업부터 실행하는 스레드 풀. concurrent.futures.Future를 반환합니다."""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or configs["worker"]["max_workers"]
+        self._queue = []  # (priority, 순번, future, fn, args, kwargs) 힙
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._shutdown = False
+        self._threads = [threading.Thread(target=self._work, name=f"ocr-pool-{i}", daemon=True)
+                         for i in range(self.max_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args, priority=PRIORITY_NORMAL, **kwargs):
+        future = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("종료된 풀에는 작업을 제출할 수 없습니다.")
+            heapq.heappush(self._queue, (priority, next(self._counter), future, fn, args, kwargs))
+            self._cond.notify()
+        return future
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._shutdown:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                _, _, future, fn, args, kwargs = heapq.heappop(self._queue)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        with self._cond:
+            self._shutdown = True
+            if cancel_futures:
+                for item in self._queue:
+                    item[2].cancel()
+                self._queue.clear()
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+@dataclass
+class OCRJob:
+    filename: str
+    first_page: int = 1
+    last_page: int = 0
+    priority: int = PRIORITY_NORMAL
+    output_path: str = ""  # 페이지 텍스트를 저장할 .txt 경로
+    searchable_output: str = ""
+    tesseract_path: str = ""  # 비어 있으면 OCRQueue.tesseract_path
+    id: int = 0
+    state: str = WAITING
+    pages_done: int = 0
+    error: str = ""
+    pipeline: "OCRPipeline" = field(default=None, repr=False)
+
+    @property
+    def total_pages(self):
+        return self.last_page - self.first_page + 1
+
+    @property
+    def percent(self):
+        return int(self.pages_done / self.total_pages * 100) if self.total_pages else 0
+
+
+class OCRQueue:
+    """OCR 작업 대기열. 작업 상태가 바뀌거나 페이지가 끝날 때마다 on_update(job)를 호출합니다.
+
+    on_update는 작업 스레드에서 호출되므로 GUI는 시그널로 UI 스레드에 넘겨야 합니다.
+    """
+
+    def __init__(self, lang=None, tesseract_path=None, max_workers=None,
+                 max_active_jobs=None, on_update=None):
+        self.lang = lang
+        self.tesseract_path = tesseract_path
+        self.executor = PriorityExecutor(max_workers)
+        self.max_active_jobs = max_active_jobs or configs["jobs"]["max_active_jobs"]
+        self.on_update = on_update
+        self.jobs = []
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._closed = False
+
+    def add(self, filename, first_page=1, last_page=None, priority=PRIORITY_NORMAL,
+            output_path=None, searchable_output=None, tesseract_path=None):
+        """작업을 추가하고 빈 자리가 있으면 바로 시작합니다."""
+        last_page = last_page or open_document(filename).page_count
+        job = OCRJob(str(filename), int(first_page), int(last_page), priority,
+                     output_path or os.path.splitext(filename)[0] + "_ocr.txt",
+                     searchable_output or "", tesseract_path or "", id=next(self._ids))
+        with self._lock:
+            self.jobs.append(job)
+        self._notify(job)
+        self._dispatch()
+        return job
+
+    def prioritize(self, filename):
+        """filename 문서의 작업을 다른 작업보다 먼저 처리합니다. 이미 제출된 페이지에는 적용되지 않습니다."""
+        filename = os.path.abspath(filename) if filename else ""
+        with self._lock:
+            for job in self.jobs:
+                viewed = os.path.abspath(job.filename) == filename
+                job.priority = PRIORITY_VIEWED if viewed else PRIORITY_NORMAL
+                if job.pipeline is not None:
+                    job.pipeline.priority = job.priority
+        self._dispatch()
+
+    def pause(self, job):
+        with self._lock:
+            if job.state == RUNNING:
+                job.pipeline.pause()
+            elif job.state != WAITING:
+                return
+            job.state = PAUSED
+        self._notify(job)
+        # 일시 정지한 작업 대신 기다리는 작업을 시작
+        self._dispatch()
+
+    def resume(self, job):
+        with self._lock:
+            if job.state != PAUSED:
+                return
+            if job.pipeline is not None:
+                job.state = RUNNING
+                job.pipeline.resume()
+            else:
+                job.state = WAITING
+        self._notify(job)
+        self._dispatch()
+
+    def cancel(self, job):
+        with self._lock:
+            if job.state in (DONE, CANCELLED, FAILED):
+                return
+            started = job.pipeline is not None
+            job.state = CANCELLED
+            if started:
+                job.pipeline.stop()
+        self._notify(job)
+        self._dispatch()
+
+    def _dispatch(self):
+        """실행 중인(일시 정지하지 않은) 작업이 max_active_jobs보다 적으면 우선순위 순서로 시작합니다."""
+        # OCR 모듈(pymupdf, PIL, pytesseract)은 첫 작업을 시작할 때 불러온다
+        from .ocr import OCRPipeline
+
+        with self._lock:
+            if self._closed:
+                return
+            active = sum(job.state == RUNNING for job in self.jobs)
+            waiting = sorted((job for job in self.jobs if job.state == WAITING),
+                             key=lambda job: (job.priority, job.id))
+            for job in waiting[:max(0, self.max_active_jobs - active)]:
+                job.state = RUNNING
+                job.pipeline = OCRPipeline(job.filename, job.first_page, job.last_page,
+                                           lang=self.lang,
+                                           tesseract_path=job.tesseract_path or self.tesseract_path,
+                                           searchable_output=job.searchable_output or None,
+                                           resume=True, executor=self.executor)
+                job.pipeline.priority = job.priority
+                threading.Thread(target=self._run, args=(job,), daemon=True,
+                                 name=f"ocr-job-{job.id}").start()
+
+    def _run(self, job):
+        # 페이지 결과를 모아 두지 않고 끝나는 대로 임시 파일에 쓴 뒤, 완료되면 출력 파일로 바꾼다
+        partial = job.output_path + ".part"
+        try:
+            with open(partial, "w", encoding="utf-8") as f:
+                for result in job.pipeline.run():
+                    if result.text:
+                        f.write(f"=== Page {result.page} ===\n{result.text}\n\n")
+                    job.pages_done += 1
+                    self._notify(job)
+
+            with self._lock:
+                # 실행 중에 취소됐으면 취소 상태를 유지
+                done = job.state != CANCELLED
+                if done:
+                    os.replace(partial, job.output_path)
+                    job.state = DONE
+            if done:
+                logger.info(f"OCR 작업 완료: {job.filename} → {job.output_path}")
+        except Exception as e:
+            logger.exception(f"OCR 작업 실패: {job.filename}")
+            with self._lock:
+                if job.state != CANCELLED:
+                    job.state = FAILED
+                    job.error = str(e)
+        finally:
+            try:
+                os.remove(partial)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.exception(f"임시 파일 삭제 실패: {partial}")
+        self._notify(job)
+        self._dispatch()
+
+    def _notify(self, job):
+        if self.on_update is not None:
+            self.on_update(job)
+
+    def close(self):
+        """모든 작업을 중단합니다. 완료된 페이지는 체크포인트에 남습니다."""
+        with self._lock:
+            self._closed = True
+            jobs = [job for job in self.jobs if job.state in (RUNNING, PAUSED)]
+        for job in jobs:
+            if job.pipeline is not None:
+                job.pipeline.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
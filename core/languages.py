@@ -0,0 +1,132 @@
+"""페이지별 OCR 언어 선택.
+
+페이지를 OCR 하기 전에 축소한 이미지로 Tesseract OSD(방향/문자 체계 감지)를 먼저 실행하고,
+감지된 문자 체계에 필요한 언어 모델만 사용합니다. 영어만 있는 페이지에 kor 모델까지
+돌리지 않습니다. OSD 방향은 페이지가 돌아간 각도이므로 이미지를 바로 세워 OCR 하고,
+세로쓰기 여부는 방향과 따로 글줄 배치로 판단해 kor_vert 모델을 사용합니다.
+"""
+from dataclasses import dataclass, asdict
+import json
+
+from config import configs
+
+_LINE_GRID = 400
+
+
+@dataclass
+class ScriptInfo:
+    """OSD 결과. orientation은 페이지가 회전된 각도(0/90/180/270)로, 반시계 방향으로 그만큼
+    돌리면 바로 선 페이지가 됩니다. vertical_lines는 돌리기 전 이미지에서 글줄이 세로로 놓였는지입니다."""
+    script: str = ""
+    script_confidence: float = 0.0
+    orientation: int = 0
+    orientation_confidence: float = 0.0
+    vertical_lines: bool = False
+
+    def to_json(self):
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, text):
+        return cls(**json.loads(text))
+
+
+def parse_osd(text):
+    """tesseract --psm 0 출력("Script: Latin" 등)을 ScriptInfo로 바꿉니다."""
+    fields = {}
+    for line in text.splitlines():
+        name, _, value = line.partition(":")
+        fields[name.strip()] = value.strip()
+    return ScriptInfo(script=fields.get("Script", ""),
+                      script_confidence=float(fields.get("Script confidence", 0) or 0),
+                      orientation=int(fields.get("Orientation in degrees", 0) or 0),
+                      orientation_confidence=float(fields.get("Orientation confidence", 0) or 0))
+
+
+def language_signature(lang, detect=None):
+    """체크포인트 등에서 같은 OCR 조건인지 구분할 언어 식별자. 페이지별 감지를 쓰면 표시를 붙입니다."""
+    if detect is None:
+        detect = configs["languages"]["detect"]
+    return f"{lang}|auto" if detect else lang
+
+
+def osd_image(image, dpi=None):
+    """OSD용 축소 그레이스케일 이미지를 만듭니다. JPEG은 축소 디코딩(draft)으로 전체를 풀지 않습니다."""
+    dpi = dpi or configs["languages"]["osd_dpi"]
+    pil = image.to_pil()
+    target_width = image.width * dpi // image.dpi if image.dpi > dpi else 0
+    if target_width and not image.mode:
+        # JPEG은 1/2, 1/4, 1/8 배율로 바로 디코딩된다
+        pil.draft("L", (target_width, pil.height * target_width // max(pil.width, 1)))
+    pil = pil.convert("L")
+    if target_width and pil.width // target_width > 1:
+        pil = pil.reduce(pil.width // target_width)
+    return pil
+
+
+def text_lines_vertical(gray):
+    """gray(OSD용 축소 이미지)의 글줄이 세로로 놓였으면 True.
+
+    잉크를 굵은 칸으로 합쳐 글자와 단어는 붙이고 글줄 사이만 비게 한 뒤, 글자가 있는 영역에서
+    빈 열(세로 글줄 사이)이 빈 행보다 훨씬 많으면 세로로 봅니다. 글줄이 하나뿐이면 False.
+    """
+    import numpy as np
+    from .preprocess import otsu_threshold
+
+    pixels = np.asarray(gray)
+    if pixels.min() == pixels.max():
+        return False
+    ink = pixels <= otsu_threshold(pixels)
+    # 긴 변이 _LINE_GRID 칸 정도가 되도록 (150 DPI A4 기준 4x4 픽셀씩) 합친다
+    k = max(1, max(ink.shape) // _LINE_GRID)
+    h, w = ink.shape[0] // k, ink.shape[1] // k
+    ink = ink[:h * k, :w * k].reshape(h, k, w, k).any(axis=(1, 3))
+    rows, cols = np.flatnonzero(ink.any(axis=1)), np.flatnonzero(ink.any(axis=0))
+    if not len(rows):
+        return False
+    body = ink[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+    # 스캔 잡티가 조금 있어도 빈 줄로 본다
+    empty_rows = (body.mean(axis=1) < 0.02).mean()
+    empty_cols = (body.mean(axis=0) < 0.02).mean()
+    return bool(empty_cols > max(2 * empty_rows, 0.2))
+
+
+class LanguageSelector:
+    """ScriptInfo로 페이지에 사용할 Tesseract 언어를 고릅니다.
+
+    설치되지 않은 언어 모델이 필요하거나 감지 신뢰도가 낮으면 기본 언어를 사용합니다.
+    """
+
+    def __init__(self, default=None, available=None):
+        settings = configs["languages"]
+        self.default = default or settings["default"]
+        self.scripts = dict(settings["scripts"])
+        self.vertical = settings["vertical"]
+        self.vertical_scripts = set(settings["vertical_scripts"])
+        self.min_confidence = settings["min_script_confidence"]
+        self.min_orientation_confidence = settings["min_orientation_confidence"]
+        # None이면 설치 여부를 확인하지 않음
+        self.available = set(available) if available is not None else None
+
+    def installed(self, lang):
+        return self.available is None or all(
+            part in self.available for part in lang.split("+"))
+
+    def rotation(self, info: ScriptInfo):
+        """페이지를 바로 세우려면 반시계 방향으로 돌릴 각도. 방향 신뢰도가 낮으면 0."""
+        if info is None or info.orientation_confidence < self.min_orientation_confidence:
+            return 0
+        return info.orientation % 360
+
+    def choose(self, info: ScriptInfo):
+        if info is None or info.script_confidence < self.min_confidence:
+            return self.default
+        # 90/270도는 페이지가 돌아간 것일 뿐이므로, 세로쓰기는 바로 세운 페이지의 글줄 방향으로 판단
+        vertical_text = info.vertical_lines != (self.rotation(info) in (90, 270))
+        if (self.vertical and info.script in self.vertical_scripts and vertical_text
+                and self.installed(self.vertical)):
+            return self.vertical
+        lang = self.scripts.get(info.script)
+        if not lang or not self.installed(lang):
+            return self.default
+        return lang
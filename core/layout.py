@@ -0,0 +1,101 @@
+"""페이지 위 이미지 배치 분석.
+
+스캐너가 한 페이지를 가로 띠 여러 개로 저장한 경우 띠들을 한 장으로 이어 붙이고,
+서로 떨어진 이미지(그림, 단)는 따로 OCR 할 수 있게 읽기 순서대로 나눕니다.
+좌표는 모두 PageImage.rect와 같은 페이지 좌표(포인트)입니다.
+"""
+from PIL import Image
+
+
+def union_rect(rects):
+    return (min(r[0] for r in rects), min(r[1] for r in rects),
+            max(r[2] for r in rects), max(r[3] for r in rects))
+
+
+def group_strips(images, tolerance):
+    """좌우 끝이 맞고 위아래로 맞닿은 이미지들을 위에서부터 한 그룹으로 묶습니다."""
+    groups = []
+    for image in sorted(images, key=lambda image: (image.rect[1], image.rect[0])):
+        x0, y0, x1, _ = image.rect
+        for group in groups:
+            gx0, _, gx1, gy1 = group[-1].rect
+            if abs(x0 - gx0) <= tolerance and abs(x1 - gx1) <= tolerance \
+                    and abs(y0 - gy1) <= tolerance:
+                group.append(image)
+                break
+        else:
+            groups.append([image])
+    return groups
+
+
+def reading_order(rects):
+    """rects의 읽기 순서(인덱스 목록). 세로로 절반 이상 겹치면 같은 줄로 보고 줄 안에서는 왼쪽부터."""
+    order = sorted(range(len(rects)), key=lambda i: (rects[i][1], rects[i][0]))
+    rows = []
+    for i in order:
+        _, y0, _, y1 = rects[i]
+        if rows:
+            _, ry0, _, ry1 = union_rect([rects[j] for j in rows[-1]])
+            overlap = min(y1, ry1) - max(y0, ry0)
+            if overlap > 0.5 * min(y1 - y0, ry1 - ry0):
+                rows[-1].append(i)
+                continue
+        rows.append([i])
+    return [i for row in rows for i in sorted(row, key=lambda i: rects[i][0])]
+
+
+def arrange_regions(images, tolerance):
+    """OCR 할 영역을 읽기 순서대로 반환합니다. 이어 붙일 띠 묶음은 PageImage 목록(list)입니다."""
+    groups = group_strips(images, tolerance)
+    rects = [union_rect([image.rect for image in group]) for group in groups]
+    return [groups[i] if len(groups[i]) > 1 else groups[i][0] for i in reading_order(rects)]
+
+
+_TRANSPOSE = {90: Image.Transpose.ROTATE_90, 180: Image.Transpose.ROTATE_180,
+              270: Image.Transpose.ROTATE_270}
+
+
+def rotate_image(image, degrees):
+    """image를 반시계 방향으로 degrees(90/180/270)만큼 돌린 raw PageImage를 만듭니다."""
+    from .ocr import PageImage
+
+    pil = image.to_pil()
+    if pil.mode not in ("L", "RGB"):
+        pil = pil.convert("RGB")
+    pil = pil.transpose(_TRANSPOSE[degrees])
+    return PageImage(pil.tobytes(), pil.width, pil.height, pil.mode, image.dpi, rect=image.rect)
+
+
+def unrotate_words(words, degrees, width, height):
+    """rotate_image()로 돌린 이미지(width x height)의 단어 좌표를 돌리기 전 이미지 좌표로 되돌립니다."""
+    if degrees == 90:
+        return [(height - y1, x0, height - y0, x1, text) for x0, y0, x1, y1, text in words]
+    if degrees == 180:
+        return [(width - x1, height - y1, width - x0, height - y0, text)
+                for x0, y0, x1, y1, text in words]
+    if degrees == 270:
+        return [(y0, width - x1, y1, width - x0, text) for x0, y0, x1, y1, text in words]
+    return words
+
+
+def stitch(parts, grayscale=False):
+    """위에서부터 놓인 띠 이미지들을 한 장의 raw PageImage로 이어 붙입니다."""
+    from .ocr import PageImage
+
+    images = [part.to_pil() for part in parts]
+    mode = "L" if grayscale or all(image.mode in ("1", "L") for image in images) else "RGB"
+    width = max(image.width for image in images)
+    images = [image.convert(mode) if image.mode != mode else image for image in images]
+    # 띠마다 해상도가 다르면 가장 넓은 띠에 맞춘다
+    images = [image if image.width == width
+              else image.resize((width, max(1, round(image.height * width / image.width))))
+              for image in images]
+
+    canvas = Image.new(mode, (width, sum(image.height for image in images)), "white")
+    y = 0
+    for image in images:
+        canvas.paste(image, (0, y))
+        y += image.height
+    rect = union_rect([part.rect for part in parts])
+    dpi = round(width / ((rect[2] - rect[0]) / 72))
+    return PageImage(canvas.tobytes(), canvas.width, canvas.height, mode, dpi, rect=rect)
@@ -0,0 +1,826 @@
+from concurrent.futures import ThreadPoolExecutor, CancelledError, Future, InvalidStateError, wait
+from collections import deque
+from dataclasses import dataclass, field
+import io
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+
+import pymupdf
+from PIL import Image
+
+from config import configs
+from .cache import OCRCache
+from .checkpoint import OCRJournal
+from .documents import open_document
+from .engines import get_engine_class
+from .languages import LanguageSelector, ScriptInfo, language_signature, osd_image, text_lines_vertical
+from .layout import arrange_regions, rotate_image, stitch, unrotate_words
+from .pagefilter import PageFilter
+from .preprocess import preprocess, signature as preprocess_signature
+from .search import SearchIndex
+from .searchable import SearchablePDFWriter
+from .telemetry import PageEvent, TelemetryLog
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(txt: str):
+    return (txt.strip()
+            .replace("\r\n", "\n")
+            .replace("\n\n", "\n")
+            .replace(" ", ""))
+
+
+def work_seconds(result):
+    """페이지를 OCR 하는 데 든 시간(추출부터 정리까지, 영역별 합계). 절약 시간 추정에 씁니다."""
+    return sum(seconds for stage, seconds in result.timings.items()
+               if stage not in ("text_layer", "filter"))
+
+
+@dataclass
+class PageImage:
+    """OCR 할 페이지 이미지.
+
+    mode가 비어 있으면 data는 인코딩된 이미지(PNG/JPEG 등)이고,
+    "L"/"RGB"이면 렌더링된 픽스맵의 raw 픽셀 버퍼입니다.
+    전처리된 이미지는 원본 대비 배율(scale)과 잘라낸 위치(offset, 전처리 후 픽셀)를 기록합니다.
+    """
+    data: bytes
+    width: int = 0
+    height: int = 0
+    mode: str = ""
+    dpi: int = 0
+    offset: tuple = (0, 0)
+    scale: float = 1.0
+    rect: tuple = ()  # 페이지에서 이미지가 그려진 영역 (x0, y0, x1, y1), 포인트 단위
+    # rect가 회전된(화면) 페이지 좌표일 때 회전 전 페이지 좌표로 바꾸는 행렬 (a, b, c, d, e, f)
+    derotate: tuple = ()
+
+    def to_source(self, words):
+        """전처리된 이미지의 픽셀 좌표 단어들을 원본 이미지 픽셀 좌표로 되돌립니다."""
+        ox, oy = self.offset
+        return [((x0 + ox) / self.scale, (y0 + oy) / self.scale,
+                 (x1 + ox) / self.scale, (y1 + oy) / self.scale, text)
+                for x0, y0, x1, y1, text in words]
+
+    def to_page(self, words):
+        """원본 이미지 픽셀 좌표 단어들을 회전(/Rotate) 전 페이지 좌표(포인트)로 바꿉니다."""
+        if not self.rect or not self.width or not self.height:
+            return []
+        x0, y0, x1, y1 = self.rect
+        sx, sy = (x1 - x0) / self.width, (y1 - y0) / self.height
+        words = [(x0 + wx0 * sx, y0 + wy0 * sy, x0 + wx1 * sx, y0 + wy1 * sy, text)
+                 for wx0, wy0, wx1, wy1, text in words]
+        if self.derotate:
+            matrix = pymupdf.Matrix(self.derotate)
+            words = [(*(pymupdf.Rect(word[:4]) * matrix), word[4]) for word in words]
+        return words
+
+    @property
+    def angle(self):
+        """이미지 가로축이 회전 전 페이지 좌표에서 놓인 각도 (pymupdf.Matrix(각도) 기준)."""
+        if not self.derotate:
+            return 0
+        a, b = self.derotate[:2]
+        return round(math.degrees(math.atan2(b, a))) % 360
+
+    def to_pil(self):
+        if self.mode:
+            # raw 버퍼를 복사/디코딩 없이 그대로 감싼다
+            return Image.frombuffer(self.mode, (self.width, self.height), self.data,
+                                    "raw", self.mode, 0, 1)
+        return Image.open(io.BytesIO(self.data))
+
+    def cache_tag(self):
+        return f"{self.mode}{self.width}x{self.height}@{self.dpi}" if self.mode else f"@{self.dpi}"
+
+
+@dataclass
+class PageResult:
+    page: int  # 1부터 시작하는 페이지 번호
+    text: str = ""
+    # ocr: Tesseract 결과, text: PDF 텍스트 레이어, blank: 빈 페이지(OCR 안 함),
+    # duplicate: 앞 페이지(duplicate_of)의 OCR 결과 재사용
+    source: str = "ocr"
+    # 단계별 소요 시간(초): text_layer, filter, extract, osd, cache, rotate, preprocess, decode, ocr,
+    # normalize
+    timings: dict = field(default_factory=dict)
+    started: float = 0.0  # 처리 시작/종료 시각 (epoch 초)
+    finished: float = 0.0
+    image_bytes: int = 0  # OCR에 넘긴 이미지 데이터 크기
+    cache_hit: bool = False
+    # 검색 가능한 PDF용 단어 위치 (x0, y0, x1, y1, text), 회전(/Rotate) 전 페이지 좌표
+    words: list = field(default_factory=list)
+    # 단어 글줄 방향. 회전 전 페이지 좌표에서 글자 가로축이 놓인 각도 (pymupdf.Matrix(각도) 기준)
+    text_angle: int = 0
+    resumed: bool = False  # 이전 작업의 체크포인트에서 읽은 결과
+    lang: str = ""  # 이 페이지 OCR에 사용한 Tesseract 언어
+    script: str = ""  # OSD로 감지한 문자 체계 (감지하지 않았으면 빈 문자열)
+    duplicate_of: int = 0
+
+
+class OCRPipeline:
+    """Qt 없이 사용할 수 있는 페이지 단위 병렬 OCR 파이프라인.
+
+    페이지 이미지 추출은 호출한 스레드에서 순서대로 수행하고(pymupdf.Document는
+    스레드 간에 공유할 수 없음), OCR은 스레드 풀에서 병렬로 수행합니다.
+    결과는 run()이 페이지 순서대로 yield 합니다.
+    """
+
+    def __init__(self, filename, first_page=1, last_page=None, lang=None,
+                 tesseract_path=None, max_workers=None, use_cache=None, backend=None,
+                 searchable_output=None, resume=False, executor=None, detect_language=None):
+        self.filename = str(filename)
+        self.first_page = int(first_page)
+        self.last_page = int(last_page) if last_page else None
+        self.lang = lang or configs["languages"]["default"]
+        # 페이지마다 OSD로 문자 체계를 감지해 언어를 고름 (configs.toml [languages]).
+        # 감지하지 않으면 모든 페이지에 lang 사용
+        if detect_language is None:
+            detect_language = configs["languages"]["detect"]
+        self.detect_language = detect_language
+        self.language_selector = None
+        # images: 임베디드 이미지만, render: 항상 렌더링, auto: 이미지가 없는 페이지만 렌더링
+        self.mode = configs["ocr"]["mode"]
+        self.render_dpi = configs["ocr"]["render_dpi"]
+        self.grayscale = configs["ocr"]["grayscale"]
+        # 페이지 면적 대비 이보다 작은 이미지(로고, 장식)는 OCR 하지 않음
+        self.min_image_area = configs["ocr"]["min_image_area"]
+        self.strip_tolerance = configs["ocr"]["strip_tolerance"]
+        # 텍스트 레이어가 충분한 페이지는 OCR 없이 그대로 사용
+        self.skip_text_layer = configs["ocr"]["skip_text_layer"]
+        self.text_layer_min_chars = configs["ocr"]["text_layer_min_chars"]
+        self.text_layer_pages = 0
+        # 빈 페이지는 건너뛰고, 앞 페이지와 거의 같은 페이지는 그 OCR 결과를 재사용 (configs.toml [page_filter])
+        self.filter_pages = configs["page_filter"]["enabled"]
+        self.page_filter = None
+        self.blank_pages = 0
+        self.duplicate_pages = 0
+        self.filter_seconds = 0.0
+        self._filtered = {}  # 중복 비교 대상 페이지 번호 → (future, PageResult)
+        self._page_seconds = {}  # 중복 비교 대상 페이지 번호 → work_seconds
+        self._ocr_seconds = 0.0  # 이번 작업에서 OCR 한 페이지들의 work_seconds 합계와 수
+        self._ocr_count = 0
+        self._reused_seconds = 0.0
+        # Tesseract 전에 이미지 전처리 (configs.toml [preprocess])
+        self.preprocess = configs["preprocess"]["enabled"]
+        # 지정하면 같은 OCR 결과(단어 위치)로 검색 가능한 PDF도 저장
+        self.searchable_output = searchable_output
+        self.searchable = bool(searchable_output)
+        self.searchable_writer = None
+        # 완료된 페이지를 저널에 기록하고, resume이면 이전 기록이 있는 페이지는 건너뜀
+        self.checkpoint = configs["checkpoint"]["enabled"]
+        self.resume_checkpoint = resume
+        self.journal = None
+        self.resumed_pages = 0
+        # 내보낸 페이지 텍스트를 전문 검색 색인에 저장 (configs.toml [search])
+        self.index_results = configs["search"]["enabled"]
+        self._indexed = []  # (페이지 번호, 텍스트)
+        # executor를 넘기면 여러 작업이 하나의 풀(core.jobs.PriorityExecutor)을 나눠 쓰고,
+        # 페이지는 priority(작을수록 먼저) 순서로 처리됨
+        self.shared_executor = executor is not None
+        self.priority = 0
+        if executor is not None:
+            self.max_workers = executor.max_workers
+            self.executor = executor
+        else:
+            self.max_workers = max_workers or configs["worker"]["max_workers"]
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # 동시에 처리 중인(제출된) 페이지 수의 상한
+        self.max_in_flight = self.max_workers * configs["worker"]["in_flight_per_worker"]
+        self.use_cache = configs["cache"]["enabled"] if use_cache is None else use_cache
+        self.cache = None
+        self._engine_id = None  # engine_id 참고
+        self._engine_id_lock = threading.Lock()
+        self.tesseract_config = ""
+        self.tesseract_path = tesseract_path
+        self.engine_class = get_engine_class(backend)
+        self._engines = []  # 워커 스레드별, 언어별로 만든 엔진 (종료 시 정리)
+        self._local = threading.local()
+        self.total_pages = 0
+        self.telemetry = None
+        self._pending = deque()  # (future, PageResult) - 페이지 순서대로 보관
+        # 스레드 풀에 제출해 아직 끝나지 않은 Future (영역 단위 포함). 종료할 때 모두 기다린다
+        self._submitted = set()
+        self._submitted_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._stop = False
+        self._running = threading.Event()  # 해제되면 다음 페이지를 제출하지 않고 대기 (일시 정지)
+        self._running.set()
+
+    def extract_text_layer(self, page: pymupdf.Page):
+        """쓸 만한 텍스트 레이어가 있으면 정리된 텍스트를, 없으면 None을 반환합니다."""
+        text = page.get_text()
+        # 공백을 제외한 글자 수로 판단 (스캔 페이지의 쪽번호 등 짧은 텍스트는 무시)
+        if sum(not c.isspace() for c in text) < self.text_layer_min_chars:
+            return None
+        return normalize_text(text)
+
+    def extract_images(self, page: pymupdf.Page):
+        """페이지에서 OCR 할 영역들을 읽기 순서대로 반환합니다. 없으면 빈 목록.
+
+        가로 띠로 나뉜 스캔은 워커에서 이어 붙일 PageImage 목록(list)으로 반환합니다.
+        """
+        if self.mode != "render":
+            images = self.placed_images(page)
+            if images:
+                return arrange_regions(images, self.strip_tolerance)
+            if self.mode == "images":
+                return []
+
+        return [self.render_page(page)]
+
+    def placed_images(self, page: pymupdf.Page):
+        """페이지에 그려진 임베디드 이미지마다 PageImage를 만듭니다. 작은 장식 이미지는 제외합니다."""
+        pdf_file = page.parent
+        min_area = abs(page.rect) * self.min_image_area
+        images = []
+        for xref in dict.fromkeys(image[0] for image in page.get_images()):
+            rects = [rect for rect in page.get_image_rects(xref)
+                     if rect.width > 0 and abs(rect) >= min_area]
+            if not rects:
+                continue
+            base_image = pdf_file.extract_image(xref)
+            # 같은 이미지를 여러 곳에 그렸으면 위치마다 OCR (같은 바이트라 캐시에 적중)
+            for rect in rects:
+                # 그려진 너비로 해상도를 추정
+                dpi = round(base_image["width"] / (rect.width / 72))
+                images.append(PageImage(base_image["image"], base_image["width"],
+                                        base_image["height"], dpi=dpi, rect=tuple(rect)))
+        return images
+
+    def render_page(self, page: pymupdf.Page):
+        """페이지 전체를 렌더링합니다. 픽스맵은 페이지마다 만들고 버리므로 메모리가 일정합니다."""
+        colorspace = pymupdf.csGRAY if self.grayscale else pymupdf.csRGB
+        pix = page.get_pixmap(dpi=self.render_dpi, colorspace=colorspace, alpha=False)
+        # 픽스맵은 회전을 적용해 그려지므로 단어 좌표를 회전 전 좌표로 되돌릴 행렬을 함께 넘긴다
+        return PageImage(pix.samples, pix.width, pix.height,
+                         "L" if pix.n == 1 else "RGB", self.render_dpi, rect=tuple(page.rect),
+                         derotate=tuple(page.derotation_matrix) if page.rotation else ())
+
+    def read_text(self, image: PageImage, result: PageResult):
+        """이미지를 OCR 합니다. 스레드 풀에서 실행되며 단계별 시간 등을 result에 기록합니다.
+
+        image가 띠 이미지 목록이면 한 장으로 이어 붙인 뒤 OCR 합니다.
+        """
+        try:
+            if isinstance(image, list):
+                started = time.perf_counter()
+                image = stitch(image, self.grayscale)
+                result.timings["stitch"] = time.perf_counter() - started
+            return self._read_text(image, result, result.timings)
+        finally:
+            result.finished = time.time()
+
+    def _read_text(self, image: PageImage, result: PageResult, timings: dict):
+        if image is None:
+            return ""
+
+        result.image_bytes = len(image.data)
+        result.lang = self.lang
+        rotation = 0
+        if self.language_selector is not None:
+            started = time.perf_counter()
+            info = self.detect_script(image)
+            timings["osd"] = time.perf_counter() - started
+            result.script = info.script
+            result.lang = self.language_selector.choose(info)
+            rotation = self.language_selector.rotation(info)
+
+        source = image
+        key = None
+        if self.cache is not None:
+            started = time.perf_counter()
+            tag = f"{self.engine_id}|{image.cache_tag()}"
+            if self.searchable:
+                tag += "|words"
+            if rotation:
+                tag += f"|rot{rotation}"
+            key = OCRCache.make_key(image.data, result.lang, tag)
+            cached = self._cache_get(key)
+            timings["cache"] = time.perf_counter() - started
+            if cached is not None:
+                result.cache_hit = True
+                if not self.searchable:
+                    return cached
+                cached = json.loads(cached)
+                result.words = source.to_page(cached["words"])
+                result.text_angle = (rotation + source.angle) % 360
+                return cached["text"]
+
+        rotated = None
+        if rotation:
+            # OSD가 감지한 방향만큼 돌려 바로 세운다. 단어 좌표는 돌리기 전 이미지로 되돌린다
+            started = time.perf_counter()
+            image = rotated = rotate_image(image, rotation)
+            timings["rotate"] = time.perf_counter() - started
+
+        if self.preprocess:
+            started = time.perf_counter()
+            image = preprocess(image)
+            timings["preprocess"] = time.perf_counter() - started
+
+        engine = self._engine(result.lang)
+        started = time.perf_counter()
+        prepared = engine.prepare(image)
+        timings["decode"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        words = None
+        if self.searchable:
+            # 텍스트와 단어 위치를 같은 OCR 호출에서 얻는다
+            txt, words = engine.recognize_words(prepared, image.dpi)
+            words = image.to_source(words)
+            if rotated is not None:
+                words = unrotate_words(words, rotation, rotated.width, rotated.height)
+        else:
+            txt = engine.recognize(prepared, image.dpi)
+        timings["ocr"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        content = normalize_text(txt)
+        timings["normalize"] = time.perf_counter() - started
+
+        if words is not None:
+            result.words = source.to_page(words)
+            # OSD로 바로 세운 각도와 렌더링할 때 적용된 페이지 회전을 합친 글줄 방향
+            result.text_angle = (rotation + source.angle) % 360
+        if key is not None:
+            if words is not None:
+                self._cache_put(key, json.dumps({"text": content, "words": words},
+                                                ensure_ascii=False))
+            else:
+                self._cache_put(key, content)
+        return content
+
+    def detect_script(self, image: PageImage):
+        """축소한 이미지로 OSD를 실행합니다. 결과는 OCR 캐시에 보관하고, 실패하면 빈 ScriptInfo."""
+        key = None
+        if self.cache is not None:
+            key = OCRCache.make_key(image.data, "osd",
+                                    f"{self.engine_id}|{configs['languages']['osd_dpi']}|lines")
+            cached = self._cache_get(key, osd=True)
+            if cached is not None:
+                return ScriptInfo.from_json(cached)
+        small = osd_image(image)
+        try:
+            info = self._engine("osd").detect_script(small)
+        except Exception as e:
+            # 글자가 너무 적은 페이지 등. 기본 언어로 OCR
+            logger.debug(f"OSD 실패, 기본 언어 사용: {e}")
+            info = ScriptInfo()
+        else:
+            info.vertical_lines = text_lines_vertical(small)
+        if key is not None:
+            self._cache_put(key, info.to_json())
+        return info
+
+    @property
+    def engine_id(self):
+        """캐시 키에 넣을 엔진 버전과 설정.
+
+        Tesseract 버전은 실제로 OCR 하는 첫 페이지에서 확인하므로, 모든 페이지에 텍스트 레이어가
+        있는 문서는 Tesseract 없이도 처리됩니다.
+        """
+        with self._engine_id_lock:
+            if self._engine_id is None:
+                version = self.engine_class.version(self.tesseract_path)
+                engine_id = f"tesseract {version}|{self.tesseract_config}"
+                if self.preprocess:
+                    engine_id += f"|{preprocess_signature()}"
+                self._engine_id = engine_id
+            return self._engine_id
+
+    def _cache_get(self, key, osd=False):
+        """캐시 조회. DB 오류(잠김, 손상 등)는 기록하고 미스로 처리해 OCR을 계속합니다."""
+        try:
+            return self.cache.get(key, osd)
+        except sqlite3.Error:
+            logger.exception(f"OCR 캐시 조회 실패: {self.filename}")
+            return None
+
+    def _cache_put(self, key, value):
+        """캐시 저장. DB 오류는 기록만 하고 저장을 건너뜁니다."""
+        try:
+            self.cache.put(key, value)
+        except sqlite3.Error:
+            logger.exception(f"OCR 캐시 저장 실패: {self.filename}")
+
+    def _engine(self, lang):
+        """현재 워커 스레드의 lang 엔진. 처음 호출될 때 만들어 이후 페이지에서 재사용합니다."""
+        engines = getattr(self._local, "engines", None)
+        if engines is None:
+            engines = self._local.engines = {}
+        engine = engines.get(lang)
+        if engine is None:
+            engine = self.engine_class(lang, self.tesseract_config, self.tesseract_path)
+            engines[lang] = engine
+            with self._lock:
+                self._engines.append(engine)
+        return engine
+
+    def _next_result(self):
+        """가장 앞선 페이지의 결과를 기다립니다. 취소된 경우 None을 반환합니다."""
+        future, result = self._pending.popleft()
+        try:
+            result.text = future.result()
+        except CancelledError:
+            return None
+        except Exception as e:
+            result.finished = result.finished or time.time()
+            self._log_event(result, error=str(e))
+            raise
+        if not result.resumed:
+            self._count_work(result)
+            self._log_event(result)
+            if self.journal is not None:
+                self.journal.append(result)
+        if self.searchable_writer is not None:
+            self.searchable_writer.add_page(result)
+        if result.text:
+            self._indexed.append((result.page, result.text))
+        return result
+
+    def _count_work(self, result: PageResult):
+        if result.source == "ocr":
+            seconds = work_seconds(result)
+            self._ocr_seconds += seconds
+            self._ocr_count += 1
+            if result.page in self._filtered:
+                self._page_seconds[result.page] = seconds
+        elif result.source == "duplicate":
+            # 원본 페이지는 순서상 먼저 내보냈으므로 이미 기록되어 있다
+            self._reused_seconds += self._page_seconds.get(result.duplicate_of, 0.0)
+
+    @property
+    def saved_seconds(self):
+        """빈/중복 페이지를 OCR 하지 않아 아낀 시간 추정치(초). 빈 페이지는 페이지당 평균으로 셉니다."""
+        average = self._ocr_seconds / self._ocr_count if self._ocr_count else 0.0
+        return self._reused_seconds + self.blank_pages * average
+
+    def _log_event(self, result: PageResult, error: str = ""):
+        if self.telemetry is not None:
+            self.telemetry.write(PageEvent.from_result(self.filename, result, error))
+
+    def _submit(self, image, result):
+        if self.shared_executor:
+            future = self.executor.submit(self.read_text, image, result, priority=self.priority)
+        else:
+            future = self.executor.submit(self.read_text, image, result)
+        with self._submitted_lock:
+            self._submitted.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self._submitted_lock:
+            self._submitted.discard(future)
+
+    def _submit_regions(self, regions, result):
+        """영역마다 따로 OCR 하도록 제출합니다. 반환한 Future는 모든 영역이 끝나면
+        읽기 순서대로 합친 텍스트로 완료되고, 취소하면 아직 시작하지 않은 영역도 취소됩니다."""
+        if len(regions) <= 1:
+            return self._submit(regions[0] if regions else None, result)
+
+        parts = [PageResult(result.page, started=result.started) for _ in regions]
+        futures = [self._submit(region, part) for region, part in zip(regions, parts)]
+        combined = Future()
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def region_done(_):
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                if any(future.cancelled() for future in futures):
+                    combined.cancel()
+                    return
+                for future in futures:
+                    if future.exception() is not None:
+                        combined.set_exception(future.exception())
+                        return
+                self._merge_regions(result, parts)
+                combined.set_result("\n".join(future.result() for future in futures
+                                              if future.result()))
+            except InvalidStateError:
+                # 중단 요청으로 이미 취소됨
+                pass
+
+        def cancel_regions(future):
+            if future.cancelled():
+                for region_future in futures:
+                    region_future.cancel()
+
+        combined.add_done_callback(cancel_regions)
+        for future in futures:
+            future.add_done_callback(region_done)
+        return combined
+
+    @staticmethod
+    def _merge_regions(result, parts):
+        """영역별 결과를 페이지 결과에 모읍니다. 단계별 시간은 영역들의 합계입니다."""
+        for part in parts:
+            for stage, seconds in part.timings.items():
+                result.timings[stage] = result.timings.get(stage, 0.0) + seconds
+            result.image_bytes += part.image_bytes
+            result.words.extend(part.words)
+        result.cache_hit = all(part.cache_hit for part in parts)
+        result.lang = ",".join(dict.fromkeys(part.lang for part in parts if part.lang))
+        result.script = ",".join(dict.fromkeys(part.script for part in parts if part.script))
+        result.finished = max(part.finished for part in parts)
+
+    def _filter_page(self, page: pymupdf.Page, page_number, timings):
+        """빈 페이지이면 "blank", 앞 페이지의 중복이면 그 페이지 번호, 아니면 None을 반환합니다."""
+        started = time.perf_counter()
+        thumbnail = self.page_filter.thumbnail(page)
+        if self.page_filter.is_blank(thumbnail):
+            verdict = "blank"
+        else:
+            verdict = self.page_filter.find_duplicate(thumbnail)
+            if verdict is None:
+                self.page_filter.remember(page_number, thumbnail)
+        timings["filter"] = time.perf_counter() - started
+        self.filter_seconds += timings["filter"]
+        return verdict
+
+    def _remember(self, page_number, future, result):
+        """중복 페이지가 결과를 재사용할 수 있게 보관합니다. PageFilter가 비교 대상에서 뺀
+        오래된 페이지는 더 보관하지 않습니다."""
+        self._filtered[page_number] = (future, result)
+        while len(self._filtered) > self.page_filter.window:
+            del self._filtered[next(iter(self._filtered))]
+
+    def _reuse(self, page_number, result):
+        """page_number 페이지의 OCR이 끝나면 그 텍스트와 단어 위치로 완료되는 Future를 만듭니다."""
+        source_future, source = self._filtered[page_number]
+        result.source = "duplicate"
+        result.duplicate_of = page_number
+        future = Future()
+
+        def copy_result(done):
+            try:
+                if done.cancelled():
+                    future.cancel()
+                elif done.exception() is not None:
+                    future.set_exception(done.exception())
+                else:
+                    result.words = list(source.words)
+                    result.text_angle = source.text_angle
+                    result.lang, result.script = source.lang, source.script
+                    result.finished = time.time()
+                    future.set_result(done.result())
+            except InvalidStateError:
+                # 중단 요청으로 이미 취소됨
+                pass
+
+        source_future.add_done_callback(copy_result)
+        return future
+
+    def _shutdown_executor(self):
+        """이 작업이 제출한 페이지를 정리합니다. 시작하지 않은 페이지(영역)는 취소하고, 이미 실행 중인
+        것은 끝날 때까지 기다려 엔진, 캐시를 닫은 뒤에 쓰지 않게 합니다. 공유 풀은 종료하지 않습니다."""
+        for future, _ in list(self._pending):
+            future.cancel()
+        with self._submitted_lock:
+            submitted = list(self._submitted)
+        for future in submitted:
+            future.cancel()
+        if not self.shared_executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        wait(submitted)
+
+    def _resumed_result(self, entry):
+        result = PageResult(entry["page"], entry["text"], entry["source"],
+                            words=entry["words"], text_angle=entry.get("text_angle", 0),
+                            resumed=True,
+                            lang=entry.get("lang", ""), script=entry.get("script", ""))
+        result.started = result.finished = time.time()
+        return result
+
+    def run(self):
+        """페이지 순서대로 PageResult를 yield 합니다."""
+        completed = False
+        writer_error = None
+        try:
+            if configs["telemetry"]["enabled"]:
+                self.telemetry = TelemetryLog()
+
+            if self.searchable:
+                self.searchable_writer = SearchablePDFWriter(self.filename, self.searchable_output)
+
+            if self.use_cache:
+                self.cache = OCRCache()
+
+            if self.detect_language:
+                self.language_selector = self._language_selector()
+
+            if self.filter_pages:
+                self.page_filter = PageFilter()
+
+            # 이미 열린 문서가 있으면 같은 mmap 버퍼로 이 스레드 전용 핸들을 연다
+            with open_document(self.filename).open_handle() as pdf_file:
+                page_count = len(pdf_file)
+                if not 1 <= self.first_page <= page_count:
+                    raise ValueError(f"첫 페이지는 1에서 {page_count} 사이여야 합니다: {self.first_page}")
+                # 여러 문서에 같은 마지막 페이지를 지정해도 짧은 문서는 끝 페이지까지만 처리
+                self.last_page = min(self.last_page or page_count, page_count)
+                if self.last_page < self.first_page:
+                    raise ValueError(f"마지막 페이지가 첫 페이지보다 앞입니다: "
+                                     f"{self.first_page} - {self.last_page}")
+                self.total_pages = self.last_page - self.first_page + 1
+                logger.info(f"PDF 열기 성공: {self.filename} (총 {len(pdf_file)} 페이지)")
+                logger.info(f"처리할 페이지 범위: {self.first_page} - {self.last_page}")
+
+                journaled = {}
+                if self.checkpoint:
+                    self.journal = OCRJournal(self.filename, self.first_page, self.last_page,
+                                              language_signature(self.lang, self.detect_language),
+                                              words=self.searchable)
+                    if self.resume_checkpoint:
+                        journaled = self.journal.load()
+                        logger.info(f"체크포인트에서 {len(journaled)} 페이지 이어서 처리")
+                    else:
+                        self.journal.discard()
+
+                for page_index in range(self.first_page, self.last_page + 1):
+                    self._running.wait()
+                    if self._stop:
+                        logger.info("작업 중단 요청됨")
+                        break
+
+                    logger.debug(f"페이지 {page_index} 처리 중...")
+                    entry = journaled.get(page_index)
+                    if entry is not None:
+                        result = self._resumed_result(entry)
+                        future = Future()
+                        future.set_result(result.text)
+                        if self.page_filter is not None and result.source == "ocr":
+                            # 이어서 처리하는 뒤쪽 페이지도 이 결과를 재사용할 수 있게 기록
+                            if self._filter_page(pdf_file[page_index - 1], page_index,
+                                                 result.timings) is None:
+                                self._remember(page_index, future, result)
+                        with self._lock:
+                            if self._stop:
+                                break
+                            self.resumed_pages += 1
+                            self._pending.append((future, result))
+                        continue
+
+                    result = PageResult(page_index, started=time.time())
+                    timings = result.timings
+                    page = pdf_file[page_index - 1]
+                    text = None
+                    if self.skip_text_layer:
+                        started = time.perf_counter()
+                        text = self.extract_text_layer(page)
+                        timings["text_layer"] = time.perf_counter() - started
+                    verdict = None
+                    if text is None and self.page_filter is not None:
+                        verdict = self._filter_page(page, page_index, timings)
+                    regions = []
+                    if text is None and verdict is None:
+                        started = time.perf_counter()
+                        regions = self.extract_images(page)
+                        timings["extract"] = time.perf_counter() - started
+
+                    with self._lock:
+                        if self._stop:
+                            break
+                        if text is not None:
+                            # 텍스트 레이어 페이지는 순서 유지를 위해 완료된 Future로 대기열에 넣는다
+                            self.text_layer_pages += 1
+                            result.source = "text"
+                            result.finished = time.time()
+                            future = Future()
+                            future.set_result(text)
+                        elif verdict == "blank":
+                            self.blank_pages += 1
+                            result.source = "blank"
+                            result.finished = time.time()
+                            future = Future()
+                            future.set_result("")
+                        elif verdict is not None:
+                            self.duplicate_pages += 1
+                            future = self._reuse(verdict, result)
+                        else:
+                            future = self._submit_regions(regions, result)
+                            if self.page_filter is not None:
+                                self._remember(page_index, future, result)
+                        self._pending.append((future, result))
+
+                    # 제출된 페이지가 상한에 도달하면 가장 앞선 페이지가 끝날 때까지 대기
+                    while len(self._pending) >= self.max_in_flight and not self._stop:
+                        result = self._next_result()
+                        if result is not None:
+                            yield result
+
+                # 남은 결과를 페이지 순서대로 내보내기
+                while self._pending and not self._stop:
+                    result = self._next_result()
+                    if result is not None:
+                        yield result
+
+            if not self._stop:
+                completed = True
+                logger.info(f"모든 페이지 처리 완료 | {self.stats_message()}")
+
+        finally:
+            self._shutdown_executor()
+            # 검색 가능한 PDF를 저장하지 못하면 저널을 지우지 않고 남겨 다시 실행할 때 이어서 만든다
+            if self.searchable_writer is not None:
+                try:
+                    self.searchable_writer.close()
+                except Exception as e:
+                    logger.exception(f"검색 가능한 PDF 저장 실패: {self.searchable_output}")
+                    writer_error = e
+                    completed = False
+            if self.journal is not None:
+                if completed:
+                    self.journal.discard()
+                else:
+                    self._save_finished_pages()
+                    self.journal.close()
+            # 실행 중이던 페이지는 _shutdown_executor()에서 모두 끝났으므로 중단해도 닫는다
+            for engine in self._engines:
+                engine.close()
+            if self.cache is not None:
+                self.cache.close()
+            if self.telemetry is not None:
+                self.telemetry.close()
+            if self.index_results and self._indexed:
+                self._index_pages()
+        if writer_error is not None:
+            raise writer_error
+
+    def _language_selector(self):
+        """설치된 언어 모델을 확인해 LanguageSelector를 만듭니다. osd 모델이 없으면 None."""
+        try:
+            available = self.engine_class.languages(self.tesseract_path)
+        except Exception as e:
+            logger.warning(f"설치된 언어 모델을 확인할 수 없어 페이지별 언어 감지를 사용하지 않습니다: {e}")
+            return None
+        if "osd" not in available:
+            logger.warning("osd.traineddata가 없어 페이지별 언어 감지를 사용하지 않습니다.")
+            return None
+        return LanguageSelector(self.lang, available)
+
+    def _index_pages(self):
+        """중단된 작업도 이미 끝난 페이지는 색인합니다. 색인 실패는 OCR 결과에 영향을 주지 않습니다."""
+        try:
+            index = SearchIndex()
+            try:
+                index.add_pages(self.filename, self._indexed)
+            finally:
+                index.close()
+        except Exception:
+            logger.exception(f"검색 색인 저장 실패: {self.filename}")
+
+    def _save_finished_pages(self):
+        """중단 시점에 이미 끝났지만 아직 내보내지 않은 페이지도 저널에 남깁니다."""
+        for future, result in self._pending:
+            if result.resumed or not future.done() or future.cancelled():
+                continue
+            if future.exception() is None:
+                result.text = future.result()
+                self.journal.append(result)
+
+    def stats_message(self):
+        message = f"텍스트 레이어 사용 {self.text_layer_pages} 페이지"
+        if self.resumed_pages:
+            message += f" / 이어서 처리 {self.resumed_pages} 페이지"
+        if self.blank_pages or self.duplicate_pages:
+            message += (f" / 빈 페이지 건너뜀 {self.blank_pages} / 중복 페이지 재사용 "
+                        f"{self.duplicate_pages} (약 {self.saved_seconds:.1f}s 절약, "
+                        f"검사 {self.filter_seconds:.1f}s)")
+        if self.cache is not None:
+            message += f" / {self.cache.stats_message()}"
+        return message
+
+    def pause(self):
+        """진행 중인 페이지는 마저 처리하고, 새 페이지는 resume() 할 때까지 제출하지 않습니다."""
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def stop(self):
+        logger.info("작업 중단 요청")
+        with self._lock:
+            self._stop = True
+            # 아직 시작되지 않은 페이지는 취소
+            if self.shared_executor:
+                for future, _ in list(self._pending):
+                    future.cancel()
+            else:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+        self._running.set()
@@ -0,0 +1,122 @@
+"""PDF 아웃라인(북마크) 읽기/쓰기.
+
+아웃라인은 PyMuPDF get_toc()와 같은 [level, title, page] 목록으로 다룹니다.
+page는 1부터 시작하는 페이지 번호입니다.
+"""
+import logging
+import os
+import shutil
+
+from config import configs
+from .documents import open_document
+
+logger = logging.getLogger(__name__)
+
+
+def read_toc(path):
+    """PDF의 아웃라인을 [level, title, page] 목록으로 읽습니다.
+
+    DocumentManager가 문서당 한 번 읽어 둔 아웃라인을 복사해 반환합니다.
+    이름 있는 대상도 페이지 번호로 풀려 있습니다.
+    """
+    toc = []
+    for level, title, page in open_document(path).toc:
+        if page < 1:
+            logger.warning(f"아웃라인 대상 페이지를 찾지 못함: {title}")
+            page = 1
+        toc.append([level, title, page])
+    return toc
+
+
+def normalize_toc(toc, page_count):
+    """PyMuPDF set_toc 규칙에 맞게 레벨(1부터, 한 번에 1씩만 깊어짐)과 페이지 범위를 보정합니다."""
+    normalized = []
+    previous_level = 0
+    for level, title, page, *rest in toc:
+        level = max(1, min(level, previous_level + 1))
+        normalized.append([level, title, min(max(page, 1), page_count)])
+        previous_level = level
+    return normalized
+
+
+def write_toc(path, toc, output_path, save_mode=None):
+    """path의 페이지에 toc 아웃라인을 붙여 output_path로 저장합니다.
+
+    save_mode가 incremental이면 아웃라인만 증분 업데이트로 덧붙이고 이미지 스트림은 다시 쓰지
+    않습니다. output_path가 path와 같은 파일이면 원본 끝에 바로 덧붙여 목차 크기에만 비례합니다.
+    다른 파일로 저장할 때는 출력 파일이 원본 내용을 모두 담아야 하므로 원본을 그대로 복사한 뒤
+    덧붙입니다. 복사는 파일 크기에 비례하지만 디코딩/재압축 없는 순차 복사라 전체를 다시 쓰는
+    것보다 훨씬 빠르고, 원본을 건드리지 않기 위해 의도적으로 감수하는 비용입니다.
+    """
+    save_mode = save_mode or configs["outline"]["save_mode"]
+    in_place = os.path.exists(output_path) and os.path.samefile(path, output_path)
+    if save_mode == "incremental":
+        import pymupdf
+
+        if not in_place:
+            shutil.copyfile(path, output_path)
+        # 증분 저장은 파일 끝에 덧붙이기만 하므로 열려 있는 원본 Document의 mmap은 그대로 유효하다
+        with pymupdf.open(output_path) as doc:
+            if doc.can_save_incrementally():
+                doc.set_toc(normalize_toc(toc, len(doc)))
+                doc.saveIncr()
+                return output_path
+        # 암호화/손상 복구된 문서 등은 증분 저장을 할 수 없으므로 전체를 다시 쓴다
+        logger.warning(f"증분 저장을 할 수 없어 전체를 다시 씁니다: {path}")
+        if not in_place:
+            os.remove(output_path)
+
+    if in_place:
+        # 읽는 파일에 바로 쓸 수 없으므로 옆에 쓴 뒤 바꿔치기
+        temp = f"{output_path}.tmp"
+        _rewrite_toc(path, toc, temp)
+        os.replace(temp, output_path)
+        return output_path
+    return _rewrite_toc(path, toc, output_path)
+
+
+def _rewrite_toc(path, toc, output_path):
+    """모든 페이지를 새 PdfWriter로 옮기고 아웃라인을 붙여 저장합니다."""
+    # pypdf는 이 경로에서만 쓰므로 필요할 때 불러온다
+    from pypdf import PdfReader, PdfWriter
+
+    reader = PdfReader(path)
+    pdf_writer = PdfWriter()
+
+    for page in reader.pages:
+        pdf_writer.add_page(page)
+
+    parents = {0: None}  # level → 해당 레벨의 마지막 항목
+    for level, title, page in normalize_toc(toc, len(reader.pages)):
+        parents[level] = pdf_writer.add_outline_item(
+            title=title,
+            page_number=page - 1,
+            parent=parents[level - 1]
+        )
+
+    pdf_writer.write(output_path)
+    return output_path
+
+
+def copy_outline(source_path, target_path, output_path):
+    """source_path의 아웃라인을 target_path에 복사해 output_path로 저장합니다.
+
+    source에 아웃라인이 없으면 None을 반환합니다.
+    """
+    toc = read_toc(source_path)
+    if not toc:
+        return None
+    return write_toc(target_path, toc, output_path)
+
+
+def unique_output_path(path, suffix, output_dir=None):
+    """path 옆(또는 output_dir)에 '<이름><suffix>.pdf' 경로를 만듭니다. 이미 있으면 _1, _2 ...를 붙입니다."""
+    output_dir = output_dir or os.path.dirname(path)
+    base_name = os.path.splitext(os.path.basename(path))[0]
+    output_path = os.path.join(output_dir, f"{base_name}{suffix}.pdf")
+
+    i = 1
+    while os.path.exists(output_path):
+        output_path = os.path.join(output_dir, f"{base_name}{suffix}_{i}.pdf")
+        i += 1
+    return output_path
@@ -0,0 +1,121 @@
+"""OCR 전 빈 페이지/중복 페이지 걸러내기.
+
+페이지를 저해상도 흑백으로 렌더링한 썸네일로 판단합니다. 여백을 뺀 영역에 배경보다
+충분히 어두운 픽셀(잉크)이 거의 없으면 빈 페이지이고, 지각 해시(pHash)가 가깝고 썸네일의
+모든 작은 칸에서 밝기 차이가 작으면 앞에서 OCR 한 페이지와 같은 페이지로 봅니다.
+해시는 서식이 같은 다른 본문 페이지도 가깝게 나오고 평균 차이는 쪽번호 몇 글자만 다른 페이지를
+구별하지 못하므로, 칸별 최대 차이로 확인합니다. 계산은 NumPy로 벡터화합니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pymupdf
+
+from config import configs
+
+HASH_SIZE = 8  # 8x8 저주파 DCT 계수 → 64비트 해시
+_DCT_SIZE = 32
+_DIFF_CELL = 2  # 중복 확인에 쓰는 칸 크기(썸네일 픽셀)
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    matrix = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(_DCT_SIZE)
+
+
+def block_mean(gray: np.ndarray, size):
+    """gray를 size x size 칸으로 나눠 칸마다 평균을 냅니다 (면적 평균 축소)."""
+    h, w = gray.shape
+    bh, bw = h // size, w // size
+    return gray[:bh * size, :bw * size].reshape(size, bh, size, bw).mean(axis=(1, 3))
+
+
+def phash(gray: np.ndarray):
+    """64비트 지각 해시. 32x32로 줄인 이미지의 2차원 DCT 저주파 계수가 중앙값보다 큰지로 만듭니다."""
+    coeffs = _DCT @ block_mean(gray.astype(np.float32), _DCT_SIZE) @ _DCT.T
+    low = coeffs[:HASH_SIZE, :HASH_SIZE].ravel()
+    # DC 성분(전체 밝기)은 중앙값 계산에서 뺀다
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def cell_means(gray: np.ndarray, cell=_DIFF_CELL):
+    """gray를 cell x cell 칸으로 나눈 칸별 평균 밝기(uint8). 중복 확인용으로 보관합니다."""
+    h, w = gray.shape
+    cells = gray[:h // cell * cell, :w // cell * cell].astype(np.float32)
+    return cells.reshape(h // cell, cell, w // cell, cell).mean(axis=(1, 3)).round().astype(np.uint8)
+
+
+def ink_ratio(gray: np.ndarray, margin, ink_delta):
+    """여백을 뺀 영역에서 배경(중앙값)보다 ink_delta 이상 어두운 픽셀의 비율."""
+    h, w = gray.shape
+    my, mx = int(h * margin), int(w * margin)
+    body = gray[my:h - my, mx:w - mx]
+    if body.size == 0:
+        return 0.0
+    background = np.median(body)
+    return float(np.count_nonzero(body < background - ink_delta)) / body.size
+
+
+@dataclass
+class Thumbnail:
+    cells: np.ndarray  # cell_means() 결과
+    hash: int
+    ink: float
+
+
+class PageFilter:
+    """한 OCR 작업 안에서 빈 페이지와 앞 페이지의 중복을 찾습니다. 추출 스레드에서만 사용합니다."""
+
+    def __init__(self, options=None):
+        options = options or configs["page_filter"]
+        self.dpi = options["dpi"]
+        self.margin = options["margin"]
+        self.ink_delta = options["ink_delta"]
+        self.blank_ink_ratio = options["blank_ink_ratio"]
+        self.duplicate_distance = options["duplicate_distance"]
+        self.duplicate_max_diff = options["duplicate_max_diff"]
+        # 메모리를 일정하게 유지하려고 최근 이만큼의 페이지만 비교 대상으로 보관
+        self.window = options["duplicate_window"]
+        self._hashes = np.zeros(0, dtype=np.uint64)
+        self._seen = []  # (페이지 번호, Thumbnail), _hashes와 같은 순서
+
+    def thumbnail(self, page: pymupdf.Page):
+        pix = page.get_pixmap(dpi=self.dpi, colorspace=pymupdf.csGRAY, alpha=False)
+        gray = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+        gray = gray[:, :pix.width]
+        if min(gray.shape) < _DCT_SIZE:
+            # 아주 작은 페이지는 해시를 만들 수 있게 늘린다
+            repeat = -(-_DCT_SIZE // min(gray.shape))
+            gray = gray.repeat(repeat, axis=0).repeat(repeat, axis=1)
+        return Thumbnail(cell_means(gray), phash(gray),
+                         ink_ratio(gray, self.margin, self.ink_delta))
+
+    def is_blank(self, thumbnail: Thumbnail):
+        return thumbnail.ink < self.blank_ink_ratio
+
+    def find_duplicate(self, thumbnail: Thumbnail):
+        """thumbnail과 거의 같은 앞 페이지 번호. 없으면 None."""
+        if not self._seen:
+            return None
+        xor = (self._hashes ^ np.uint64(thumbnail.hash)).view(np.uint8)
+        distances = np.unpackbits(xor).reshape(-1, 64).sum(axis=1)
+        # 해시가 가까운 후보만 썸네일을 직접 비교
+        for i in np.flatnonzero(distances <= self.duplicate_distance):
+            page, seen = self._seen[i]
+            if seen.cells.shape != thumbnail.cells.shape:
+                continue
+            if np.abs(seen.cells.astype(np.int16) - thumbnail.cells).max() <= self.duplicate_max_diff:
+                return page
+        return None
+
+    def remember(self, page_number, thumbnail: Thumbnail):
+        """OCR 할 페이지로 기록해 이후 페이지의 중복 비교 대상으로 씁니다."""
+        self._hashes = np.append(self._hashes, np.uint64(thumbnail.hash))[-self.window:]
+        self._seen.append((page_number, thumbnail))
+        del self._seen[:-self.window]
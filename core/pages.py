@@ -0,0 +1,160 @@
+"""PDF 페이지 작업: 나누기, 합치기, 페이지 범위 추출.
+
+PyMuPDF insert_pdf로 페이지를 복사하고 garbage/deflate 옵션으로 저장해 중복 객체를 합칩니다.
+나누기는 원본 핸들 하나를 열어 둔 채 출력 파일마다 필요한 페이지만 복사하므로
+큰 문서를 수백 개로 나눠도 원본을 한 번만 읽습니다. 아웃라인은 출력 페이지 번호로 옮겨 보존합니다.
+"""
+import logging
+import os
+import re
+
+from config import configs
+from .documents import open_document
+from .outline import normalize_toc, read_toc, unique_output_path
+
+logger = logging.getLogger(__name__)
+
+_RANGE = re.compile(r"^(\d*)\s*-\s*(\d*)$|^(\d+)$")
+_INVALID_FILENAME = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def parse_ranges(spec, page_count):
+    """"1-10, 15, 20-" 같은 페이지 범위를 [(첫 페이지, 마지막 페이지)] 목록(1부터 시작)으로 바꿉니다."""
+    ranges = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        match = _RANGE.match(part)
+        if not match:
+            raise ValueError(f"잘못된 페이지 범위: {part}")
+        if match[3]:
+            first = last = int(match[3])
+        else:
+            first = int(match[1]) if match[1] else 1
+            last = int(match[2]) if match[2] else page_count
+        if not 1 <= first <= last <= page_count:
+            raise ValueError(f"페이지 범위는 1에서 {page_count} 사이여야 합니다: {part}")
+        ranges.append((first, last))
+    if not ranges:
+        raise ValueError("페이지 범위가 비어 있습니다.")
+    return ranges
+
+
+def outline_ranges(toc, page_count):
+    """최상위 아웃라인 항목마다 (제목, 첫 페이지, 마지막 페이지)를 만듭니다.
+
+    첫 항목 앞의 페이지(표지, 머리말 등)는 "front" 범위가 됩니다.
+    같은 페이지에서 시작하는 항목이 여러 개면 마지막 항목만 남습니다.
+    """
+    starts = [(title, page) for level, title, page, *_ in toc if level == 1]
+    if not starts:
+        return []
+    if starts[0][1] > 1:
+        starts.insert(0, ("front", 1))
+    ranges = []
+    for i, (title, first) in enumerate(starts):
+        last = starts[i + 1][1] - 1 if i + 1 < len(starts) else page_count
+        if first <= last:
+            ranges.append((title, first, last))
+    return ranges
+
+
+def remap_toc(toc, ranges):
+    """원본 아웃라인에서 ranges에 들어가는 항목만 남기고 출력 문서의 페이지 번호로 바꿉니다."""
+    offsets = []  # (첫 페이지, 마지막 페이지, 출력에서 첫 페이지 앞까지의 페이지 수)
+    copied = 0
+    for first, last in ranges:
+        offsets.append((first, last, copied))
+        copied += last - first + 1
+
+    remapped = []
+    for level, title, page, *_ in toc:
+        for first, last, before in offsets:
+            if first <= page <= last:
+                remapped.append([level, title, before + page - first + 1])
+                break
+    return normalize_toc(remapped, copied) if copied else []
+
+
+def save_options():
+    return {"garbage": configs["pages"]["garbage"], "deflate": configs["pages"]["deflate"]}
+
+
+def _write_pages(source, ranges, toc, output_path):
+    """열려 있는 원본 핸들에서 ranges 페이지를 새 문서로 복사해 저장합니다."""
+    import pymupdf
+
+    with pymupdf.open() as output:
+        for first, last in ranges:
+            output.insert_pdf(source, from_page=first - 1, to_page=last - 1)
+        output.set_toc(remap_toc(toc, ranges))
+        output.save(output_path, **save_options())
+    return output_path
+
+
+def _part_name(index, title):
+    name = _INVALID_FILENAME.sub("_", title).strip("._")[:60]
+    return f"_{index:02d}_{name}" if name else f"_{index:02d}"
+
+
+def split_pdf(path, ranges=None, output_dir=None, on_progress=None):
+    """path를 ranges마다 하나의 파일로 나눕니다. ranges가 없으면 최상위 아웃라인 항목(장)마다 나눕니다.
+
+    만든 파일 경로 목록을 반환합니다. on_progress(완료 수, 전체 수)로 진행 상황을 알립니다.
+    """
+    document = open_document(path)
+    toc = read_toc(path)
+    if ranges:
+        parts = [(f"_p{first}-{last}", first, last) for first, last in ranges]
+    else:
+        parts = [(_part_name(i, title), first, last)
+                 for i, (title, first, last) in enumerate(
+                     outline_ranges(toc, document.page_count), start=1)]
+        if not parts:
+            raise ValueError("나눌 기준이 되는 최상위 아웃라인이 없습니다. 페이지 범위를 지정하세요.")
+
+    outputs = []
+    # 원본은 한 번만 열어 모든 출력 파일에서 같이 쓴다
+    with document.open_handle() as source:
+        for suffix, first, last in parts:
+            output_path = unique_output_path(path, suffix, output_dir)
+            outputs.append(_write_pages(source, [(first, last)], toc, output_path))
+            if on_progress is not None:
+                on_progress(len(outputs), len(parts))
+    logger.info(f"PDF 나누기 완료: {path} → {len(outputs)}개 파일")
+    return outputs
+
+
+def extract_pages(path, ranges, output_path):
+    """ranges 페이지를 순서대로 모아 output_path 하나로 저장합니다."""
+    with open_document(path).open_handle() as source:
+        return _write_pages(source, ranges, read_toc(path), output_path)
+
+
+def merge_pdfs(paths, output_path, file_bookmarks=False, on_progress=None):
+    """paths를 순서대로 이어 붙여 output_path로 저장합니다. 각 파일의 아웃라인을 보존합니다.
+
+    file_bookmarks이면 파일마다 파일 이름으로 된 최상위 항목을 만들고 원래 아웃라인을 그 아래에 둡니다.
+    """
+    import pymupdf
+
+    toc = []
+    with pymupdf.open() as merged:
+        for i, path in enumerate(paths, start=1):
+            with pymupdf.open(path) as source:
+                if source.needs_pass:
+                    raise ValueError(f"암호가 걸린 PDF는 합칠 수 없습니다: {path}")
+                start = len(merged)
+                merged.insert_pdf(source)
+                if file_bookmarks:
+                    title = os.path.splitext(os.path.basename(path))[0]
+                    toc.append([1, title, start + 1])
+                for level, title, page, *_ in source.get_toc():
+                    toc.append([level + file_bookmarks, title, start + max(page, 1)])
+            if on_progress is not None:
+                on_progress(i, len(paths))
+        merged.set_toc(normalize_toc(toc, len(merged)))
+        merged.save(output_path, **save_options())
+    logger.info(f"PDF 합치기 완료: {len(paths)}개 파일 → {output_path}")
+    return output_path
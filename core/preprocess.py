@@ -0,0 +1,139 @@
+"""OCR 전 이미지 전처리 (그레이스케일, DPI 정규화, 테두리 제거, 기울기 보정, 이진화).
+
+고해상도 컬러 스캔을 깨끗한 300 DPI 흑백 이미지로 바꾸면 Tesseract가 훨씬 빨라지고
+정확도는 같거나 더 좋습니다. 계산은 PIL 버퍼 위에서 NumPy로 벡터화합니다.
+"""
+import json
+
+import numpy as np
+from PIL import Image
+
+from config import configs
+
+
+def signature(options=None):
+    """캐시 키에 넣을 전처리 설정 문자열."""
+    options = options or configs["preprocess"]
+    return json.dumps(options, sort_keys=True)
+
+
+def otsu_threshold(gray: np.ndarray):
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    levels = np.arange(256)
+    weight = np.cumsum(hist)
+    mean = np.cumsum(hist * levels)
+    total_weight, total_mean = weight[-1], mean[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = (total_mean * weight - mean * total_weight) ** 2 / (weight * (total_weight - weight))
+    return int(np.nanargmax(between))
+
+
+def _box3(values: np.ndarray):
+    """3x3 이웃 평균."""
+    padded = np.pad(values, 1, mode="edge")
+    h, w = values.shape
+    return sum(padded[y:y + h, x:x + w] for y in range(3) for x in range(3)) / 9
+
+
+def sauvola(gray: np.ndarray, window: int, k: float):
+    """Sauvola 적응형 이진화.
+
+    창 크기의 절반인 블록 단위로 평균/표준편차를 구하고 3x3 블록으로 평활한 뒤 펼칩니다.
+    픽셀 단위 적분 영상보다 훨씬 빠르고 메모리를 적게 씁니다.
+    """
+    block = max(1, window // 2)
+    h, w = gray.shape
+    bh, bw = -(-h // block), -(-w // block)
+    padded = np.pad(gray, ((0, bh * block - h), (0, bw * block - w)), mode="edge")
+    blocks = padded.reshape(bh, block, bw, block).astype(np.float32)
+    mean = _box3(blocks.mean(axis=(1, 3)))
+    mean_sq = _box3(np.square(blocks).mean(axis=(1, 3)))
+    std = np.sqrt(np.maximum(mean_sq - mean ** 2, 0))
+    threshold = mean * (1 + k * (std / 128 - 1))
+    threshold = np.repeat(np.repeat(threshold, block, axis=0), block, axis=1)[:h, :w]
+    return np.where(gray > threshold, 255, 0).astype(np.uint8)
+
+
+def crop_dark_borders(gray: np.ndarray, max_fraction=0.1, dark=64, ratio=0.5):
+    """스캔 가장자리의 검은 띠를 잘라냅니다. (잘린 배열, (x, y) 오프셋)을 반환합니다."""
+    h, w = gray.shape
+    dark_rows = (gray < dark).mean(axis=1) > ratio
+    dark_cols = (gray < dark).mean(axis=0) > ratio
+
+    def edge_run(flags, limit):
+        # 가장자리부터 연속된 어두운 줄 수
+        run = np.argmin(flags[:limit]) if not flags[:limit].all() else limit
+        return int(run)
+
+    top = edge_run(dark_rows, int(h * max_fraction))
+    bottom = edge_run(dark_rows[::-1], int(h * max_fraction))
+    left = edge_run(dark_cols, int(w * max_fraction))
+    right = edge_run(dark_cols[::-1], int(w * max_fraction))
+    return gray[top:h - bottom, left:w - right], (left, top)
+
+
+def estimate_skew(gray: np.ndarray, max_angle: float, step=0.25, sample_width=1000):
+    """투영 프로파일 분산이 가장 큰 각도(도)를 찾습니다. 축소한 이미지에서 계산합니다."""
+    factor = max(1, gray.shape[1] // sample_width)
+    small = gray[::factor, ::factor]
+    ys, xs = np.nonzero(small < otsu_threshold(small))
+    if len(ys) < 100:
+        return 0.0
+
+    angles = np.arange(-max_angle, max_angle + step / 2, step)
+    radians = np.deg2rad(angles)
+    best_angle, best_score = 0.0, -1.0
+    for angle, theta in zip(angles, radians):
+        rows = np.round(ys * np.cos(theta) + xs * np.sin(theta)).astype(np.int64)
+        rows -= rows.min()
+        score = float((np.bincount(rows).astype(np.float64) ** 2).sum())
+        if score > best_score:
+            best_angle, best_score = float(angle), score
+    return best_angle
+
+
+def preprocess(image, options=None):
+    """PageImage를 전처리해 raw "L" 버퍼의 PageImage로 반환합니다."""
+    from .ocr import PageImage
+
+    options = options or configs["preprocess"]
+    pil = image.to_pil()
+    dpi = image.dpi
+    scale = 1.0
+
+    binarize = options["binarize"]
+    if options["grayscale"] or binarize != "none":
+        pil = pil.convert("L")
+
+    # DPI 정규화: 목표보다 높은 해상도는 줄인다 (원본 DPI를 모르면 건너뜀)
+    target_dpi = options["target_dpi"]
+    if target_dpi and dpi and dpi > target_dpi * 1.1:
+        scale = target_dpi / dpi
+        pil = pil.resize((max(1, round(pil.width * scale)), max(1, round(pil.height * scale))),
+                         Image.Resampling.BOX)
+        dpi = target_dpi
+
+    if pil.mode != "L":
+        # 컬러 이미지는 전처리 없이 크기만 조정해서 그대로 사용
+        return PageImage(pil.tobytes(), pil.width, pil.height, pil.mode, dpi, scale=scale)
+
+    gray = np.asarray(pil)
+    offset = (0, 0)
+    if options["crop_borders"]:
+        gray, offset = crop_dark_borders(gray)
+
+    if options["deskew"]:
+        angle = estimate_skew(gray, options["deskew_max_angle"])
+        if abs(angle) >= 0.1:
+            rotated = Image.fromarray(gray).rotate(-angle, resample=Image.Resampling.BILINEAR,
+                                                    fillcolor=255)
+            gray = np.asarray(rotated)
+
+    if binarize == "otsu":
+        gray = np.where(gray > otsu_threshold(gray), 255, 0).astype(np.uint8)
+    elif binarize == "sauvola":
+        gray = sauvola(gray, options["sauvola_window"], options["sauvola_k"])
+
+    gray = np.ascontiguousarray(gray)
+    h, w = gray.shape
+    return PageImage(gray.tobytes(), w, h, "L", dpi, offset=offset, scale=scale)
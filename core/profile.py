@@ -0,0 +1,220 @@
+"""문서 분석 프로필.
+
+PDF를 열면 백그라운드에서 페이지마다 종류(텍스트/이미지/벡터/빈 페이지), 임베디드 이미지 xref와
+크기를 조사하고 기존 아웃라인과 예상 OCR 시간을 정리합니다. 결과는 문서 지문(내용 해시)을
+키로 저장해 같은 파일을 다시 열면 바로 사용합니다. 분석하면서 DocumentManager의 캐시(페이지 수,
+아웃라인)와 문서 지문도 미리 계산되므로 이후의 OCR/아웃라인 작업이 기다리지 않고 시작합니다.
+"""
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+import json
+import logging
+import threading
+import time
+
+from config import configs, DATA_DIR
+from .checkpoint import document_fingerprint
+from .documents import open_document
+from .outline import read_toc
+
+logger = logging.getLogger(__name__)
+
+PAGE_TEXT = "text"  # 쓸 만한 텍스트 레이어가 있어 OCR 하지 않는 페이지
+PAGE_IMAGE = "image"  # 임베디드 이미지(스캔)를 OCR 할 페이지
+PAGE_VECTOR = "vector"  # 이미지 없이 그려진 페이지. 렌더링해서 OCR
+PAGE_BLANK = "blank"  # 글자, 이미지, 도형을 하나도 그리지 않는 페이지
+
+# 분석 설정이나 형식이 바뀌면 저장된 프로필을 다시 만든다
+_VERSION = 2
+
+
+@dataclass
+class PageProfile:
+    kind: str
+    xrefs: list = field(default_factory=list)  # 페이지에 쓰인 임베디드 이미지 xref
+    pixels: int = 0  # OCR 할 픽셀 수 (이미지 합계, 벡터 페이지는 렌더링 크기)
+
+
+@dataclass
+class DocumentProfile:
+    path: str
+    fingerprint: str
+    page_count: int
+    pages: list  # PageProfile, 페이지 순서
+    toc: list  # 기존 아웃라인 [level, title, page]
+    settings: dict = field(default_factory=dict)
+    seconds: float = 0.0  # 분석에 걸린 시간
+
+    def count(self, kind):
+        return sum(page.kind == kind for page in self.pages)
+
+    @property
+    def image_count(self):
+        return sum(len(page.xrefs) for page in self.pages)
+
+    def ocr_pages(self, skip_blank=False):
+        """텍스트 레이어가 없어 OCR 할 페이지 번호(1부터) 목록. skip_blank이면 빈 페이지도 뺍니다."""
+        kinds = (PAGE_IMAGE, PAGE_VECTOR) if skip_blank else (PAGE_IMAGE, PAGE_VECTOR, PAGE_BLANK)
+        return [i for i, page in enumerate(self.pages, start=1) if page.kind in kinds]
+
+    def ocr_range(self, skip_blank=False):
+        """ocr_pages()의 첫 페이지와 마지막 페이지. 없으면 None."""
+        pages = self.ocr_pages(skip_blank)
+        return (pages[0], pages[-1]) if pages else None
+
+    def estimated_ocr_seconds(self, first_page=1, last_page=None, max_workers=None):
+        """픽셀 수로 추정한 OCR 시간(초). 워커 수만큼 나눕니다."""
+        max_workers = max_workers or configs["worker"]["max_workers"]
+        pages = self.pages[first_page - 1:last_page]
+        megapixels = sum(page.pixels for page in pages
+                         if page.kind in (PAGE_IMAGE, PAGE_VECTOR)) / 1e6
+        return megapixels * configs["profile"]["ocr_seconds_per_megapixel"] / max_workers
+
+    def summary(self):
+        seconds = int(self.estimated_ocr_seconds())
+        return (f"텍스트 {self.count(PAGE_TEXT)} / 이미지 {self.count(PAGE_IMAGE)} / "
+                f"벡터 {self.count(PAGE_VECTOR)} / 빈 페이지 {self.count(PAGE_BLANK)}, "
+                f"이미지 {self.image_count}개, 아웃라인 {len(self.toc)}개, "
+                f"예상 OCR 시간 {seconds // 60:02d}:{seconds % 60:02d}")
+
+    def to_json(self):
+        data = asdict(self)
+        # 페이지가 수만 개여도 작게 저장되도록 페이지는 [종류, xref 목록, 픽셀 수]로
+        data["pages"] = [[page.kind, page.xrefs, page.pixels] for page in self.pages]
+        return json.dumps(data, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text):
+        data = json.loads(text)
+        data["pages"] = [PageProfile(*page) for page in data["pages"]]
+        return cls(**data)
+
+
+def _settings():
+    return {"version": _VERSION,
+            "text_layer_min_chars": configs["ocr"]["text_layer_min_chars"],
+            "render_dpi": configs["ocr"]["render_dpi"]}
+
+
+def classify_page(page, settings):
+    """렌더링 없이 페이지 종류와 OCR 할 픽셀 수를 구합니다.
+
+    빈 페이지는 내용 스트림 길이가 아니라 실제로 그리는 것으로 판단합니다
+    (Form XObject 하나만 그리는 페이지는 내용 스트림이 아주 짧습니다).
+    """
+    # (xref, smask, width, height, ...). Form XObject 안의 이미지도 포함하고,
+    # 같은 이미지를 여러 번 그려도 한 번만 센다
+    images = {image[0]: image for image in page.get_images(full=True)}
+    chars = sum(not c.isspace() for c in page.get_text())
+    if chars >= settings["text_layer_min_chars"]:
+        return PageProfile(PAGE_TEXT, list(images))
+    if images:
+        return PageProfile(PAGE_IMAGE, list(images),
+                           sum(image[2] * image[3] for image in images.values()))
+    if chars or page.get_drawings():
+        scale = settings["render_dpi"] / 72
+        return PageProfile(PAGE_VECTOR, [],
+                           int(page.rect.width * scale) * int(page.rect.height * scale))
+    return PageProfile(PAGE_BLANK)
+
+
+def _profile_path(fingerprint):
+    directory = Path(configs["profile"]["path"] or DATA_DIR / "profiles")
+    return directory / f"{fingerprint[:32]}.json"
+
+
+def load_profile(fingerprint):
+    """저장된 프로필. 없거나 분석 설정이 바뀌었으면 None."""
+    path = _profile_path(fingerprint)
+    try:
+        profile = DocumentProfile.from_json(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    return profile if profile.settings == _settings() else None
+
+
+def save_profile(profile):
+    path = _profile_path(profile.fingerprint)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 쓰는 도중에 종료돼도 깨진 파일이 남지 않도록 바꿔치기
+    temp = path.with_suffix(".tmp")
+    temp.write_text(profile.to_json(), encoding="utf-8")
+    temp.replace(path)
+
+
+def analyze(path, cancel=None, on_progress=None):
+    """path의 DocumentProfile을 반환합니다. 저장된 프로필이 있으면 다시 분석하지 않습니다.
+
+    cancel(threading.Event)이 설정되면 중간에 None을 반환합니다.
+    on_progress(완료 페이지 수, 전체 페이지 수)는 100 페이지마다 호출됩니다.
+    """
+    path = str(path)
+    fingerprint = document_fingerprint(path)
+    document = open_document(path)
+    try:
+        # 저장된 프로필을 쓰더라도 이후 작업이 쓸 문서 캐시는 채워 둔다
+        page_count = document.page_count
+        toc = read_toc(path)
+        profile = load_profile(fingerprint) if configs["profile"]["enabled"] else None
+        if profile is not None:
+            profile.path = path
+            return profile
+
+        started = time.perf_counter()
+        settings = _settings()
+        doc = document.handle()
+        pages = []
+        for i in range(page_count):
+            if cancel is not None and cancel.is_set():
+                return None
+            pages.append(classify_page(doc[i], settings))
+            if on_progress is not None and (i + 1) % 100 == 0:
+                on_progress(i + 1, page_count)
+    finally:
+        # 이 스레드의 핸들만 닫는다 (mmap과 다른 스레드의 핸들은 그대로)
+        document.release()
+
+    profile = DocumentProfile(path, fingerprint, page_count, pages, toc, settings,
+                              time.perf_counter() - started)
+    if configs["profile"]["enabled"]:
+        try:
+            save_profile(profile)
+        except OSError:
+            logger.exception(f"문서 프로필 저장 실패: {path}")
+    logger.info(f"문서 분석 완료: {path} ({profile.seconds:.2f}s) | {profile.summary()}")
+    return profile
+
+
+class AnalysisTask:
+    """analyze()를 데몬 스레드에서 실행하고 끝나면 on_done(profile)을 호출합니다.
+
+    on_done은 작업 스레드에서 호출되므로 GUI는 시그널로 UI 스레드에 넘겨야 합니다.
+    """
+
+    def __init__(self, path, on_done=None, on_progress=None):
+        self.path = str(path)
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.profile = None
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="analysis", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.profile = analyze(self.path, self._cancel, self.on_progress)
+        except Exception:
+            logger.exception(f"문서 분석 실패: {self.path}")
+            return
+        if self.profile is not None and not self._cancel.is_set() and self.on_done is not None:
+            self.on_done(self.profile)
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        return self.profile
@@ -0,0 +1,153 @@
+"""페이지 미리보기 렌더링.
+
+PyMuPDF 픽스맵을 스레드 풀에서 만들고, (페이지, 배율)별로 메모리 상한이 있는 LRU 캐시에 보관합니다.
+Qt 없이 동작하며 GUI는 on_rendered 콜백으로 결과를 받습니다.
+"""
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import logging
+import threading
+
+from config import configs
+from .documents import open_document
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RenderedPage:
+    page: int  # 0부터 시작하는 페이지 번호
+    zoom: float
+    width: int
+    height: int
+    samples: bytes  # RGB888 raw 픽셀
+
+    @property
+    def key(self):
+        return self.page, self.zoom
+
+
+class RenderCache:
+    """(페이지, 배율) → RenderedPage LRU 캐시. 픽셀 바이트 합계가 max_mb를 넘으면 오래된 것부터 버립니다."""
+
+    def __init__(self, max_mb=None):
+        if max_mb is None:
+            max_mb = configs["thumbnails"]["cache_mb"]
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.size = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            rendered = self._items.get(key)
+            if rendered is not None:
+                self._items.move_to_end(key)
+            return rendered
+
+    def put(self, rendered: RenderedPage):
+        with self._lock:
+            old = self._items.pop(rendered.key, None)
+            if old is not None:
+                self.size -= len(old.samples)
+            self._items[rendered.key] = rendered
+            self.size += len(rendered.samples)
+            while self.size > self.max_bytes and len(self._items) > 1:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted.samples)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+
+class PageRenderer:
+    """스레드 풀에서 페이지를 렌더링합니다.
+
+    pymupdf.Document는 스레드 간에 공유할 수 없으므로 렌더 스레드마다 핸들을 따로 엽니다.
+    핸들은 DocumentManager의 mmap 버퍼를 공유하므로 파일을 다시 읽지 않습니다.
+    같은 (페이지, 배율) 요청은 하나로 합치고, prefetch()로 범위를 옮기면 범위 밖의
+    아직 시작하지 않은 요청은 취소합니다.
+    """
+
+    def __init__(self, filename, max_workers=None, cache=None, on_rendered=None):
+        self.filename = str(filename)
+        self.cache = cache or RenderCache()
+        self.on_rendered = on_rendered
+        self.document = open_document(self.filename)
+        self.page_count = self.document.page_count
+        self.first_page_size = (0, 0)
+        if self.page_count:
+            rect = self.document.handle()[0].rect
+            self.first_page_size = (rect.width, rect.height)
+        max_workers = max_workers or configs["thumbnails"]["render_workers"]
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="render")
+        self._local = threading.local()
+        self._docs = []
+        self._pending = {}  # (페이지, 배율) → Future
+        self._lock = threading.Lock()
+
+    def _document(self):
+        doc = getattr(self._local, "doc", None)
+        if doc is None:
+            doc = self.document.open_handle()
+            self._local.doc = doc
+            with self._lock:
+                self._docs.append(doc)
+        return doc
+
+    def _render(self, page, zoom):
+        import pymupdf
+
+        pix = self._document()[page].get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+        rendered = RenderedPage(page, zoom, pix.width, pix.height, pix.samples)
+        self.cache.put(rendered)
+        if self.on_rendered is not None:
+            self.on_rendered(rendered)
+        return rendered
+
+    def _done(self, key, future):
+        with self._lock:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"페이지 {key[0] + 1} 렌더링 실패: {future.exception()}")
+
+    def request(self, page, zoom):
+        """캐시에 있으면 RenderedPage를 바로 반환하고, 없으면 렌더링을 예약한 뒤 None을 반환합니다."""
+        zoom = round(zoom, 4)
+        key = (page, zoom)
+        rendered = self.cache.get(key)
+        if rendered is not None:
+            return rendered
+        with self._lock:
+            if key not in self._pending:
+                future = self.executor.submit(self._render, page, zoom)
+                self._pending[key] = future
+                future.add_done_callback(lambda f, key=key: self._done(key, f))
+        return None
+
+    def prefetch(self, center, zoom, behind=None, ahead=None):
+        """center 앞뒤 페이지를 가까운 순서로 예약하고, 범위 밖의 대기 중인 요청은 취소합니다."""
+        behind = configs["thumbnails"]["prefetch_pages"] if behind is None else behind
+        ahead = configs["thumbnails"]["prefetch_pages"] if ahead is None else ahead
+        first, last = max(0, center - behind), min(self.page_count - 1, center + ahead)
+        zoom = round(zoom, 4)
+
+        with self._lock:
+            stale = [future for (page, page_zoom), future in self._pending.items()
+                     if page_zoom != zoom or not first <= page <= last]
+        for future in stale:
+            future.cancel()
+
+        pages = sorted(range(first, last + 1), key=lambda page: abs(page - center))
+        return [rendered for rendered in (self.request(page, zoom) for page in pages)
+                if rendered is not None]
+
+    def close(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        for doc in self._docs:
+            doc.close()
+        self._docs.clear()
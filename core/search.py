@@ -0,0 +1,161 @@
+"""OCR 결과 전문 검색 색인 (SQLite FTS5).
+
+OCR 텍스트는 normalize_text()에서 공백이 모두 제거되므로 단어 단위로 나눌 수 없습니다.
+그래서 글자 바이그램(2-gram)을 토큰으로 색인하고, 검색어도 같은 방식으로 나눠
+연속된 바이그램 구(phrase)로 찾습니다. 한국어처럼 띄어쓰기가 없는 부분 문자열도 찾을 수 있습니다.
+"""
+from dataclasses import dataclass
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from config import configs, DATA_DIR
+
+_RUN = re.compile(r"\w+")
+
+
+def bigrams(text):
+    """글자/숫자 연속 구간마다 바이그램을 만듭니다. 한 글자 구간은 그대로 둡니다."""
+    grams = []
+    for run in _RUN.findall(text.lower()):
+        if len(run) == 1:
+            grams.append(run)
+        else:
+            grams.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return grams
+
+
+def build_query(query):
+    """검색어를 FTS5 MATCH 식으로 바꿉니다. 구간마다 바이그램 구를 만들고 AND로 묶습니다."""
+    phrases = []
+    for run in _RUN.findall(query.lower()):
+        if len(run) == 1:
+            # 한 글자는 그 글자로 시작하는 바이그램을 접두사 검색
+            phrases.append(f'"{run}"*')
+        else:
+            phrases.append('"' + " ".join(run[i:i + 2] for i in range(len(run) - 1)) + '"')
+    return " AND ".join(phrases)
+
+
+@dataclass
+class SearchHit:
+    path: str
+    page: int  # 1부터 시작하는 페이지 번호
+    snippet: str
+    score: float
+
+
+class SearchIndex:
+    """문서별 페이지 OCR 텍스트 색인. 여러 스레드에서 사용할 수 있습니다."""
+
+    SNIPPET_CHARS = 30
+
+    def __init__(self, path=None):
+        self.path = Path(path or configs["search"]["path"] or DATA_DIR / "search_index.sqlite3")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            " id INTEGER PRIMARY KEY,"
+            " path TEXT UNIQUE NOT NULL,"
+            " updated REAL NOT NULL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " id INTEGER PRIMARY KEY,"
+            " document_id INTEGER NOT NULL REFERENCES documents(id),"
+            " page INTEGER NOT NULL,"
+            " text TEXT NOT NULL,"
+            " UNIQUE (document_id, page))")
+        # rowid = pages.id
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(grams)")
+        self._conn.commit()
+
+    def add_pages(self, path, pages):
+        """(페이지 번호, 텍스트) 목록을 색인합니다. 이미 색인된 페이지는 새 텍스트로 바꿉니다."""
+        path = os.path.abspath(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO documents (path, updated) VALUES (?, ?)"
+                " ON CONFLICT (path) DO UPDATE SET updated = excluded.updated",
+                (path, time.time()))
+            document_id = self._conn.execute(
+                "SELECT id FROM documents WHERE path = ?", (path,)).fetchone()[0]
+            for page, text in pages:
+                row = self._conn.execute(
+                    "SELECT id FROM pages WHERE document_id = ? AND page = ?",
+                    (document_id, page)).fetchone()
+                if row is None:
+                    page_id = self._conn.execute(
+                        "INSERT INTO pages (document_id, page, text) VALUES (?, ?, ?)",
+                        (document_id, page, text)).lastrowid
+                else:
+                    page_id = row[0]
+                    self._conn.execute("UPDATE pages SET text = ? WHERE id = ?", (text, page_id))
+                    self._conn.execute("DELETE FROM pages_fts WHERE rowid = ?", (page_id,))
+                self._conn.execute("INSERT INTO pages_fts (rowid, grams) VALUES (?, ?)",
+                                   (page_id, " ".join(bigrams(text))))
+
+    def remove(self, path):
+        path = os.path.abspath(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM pages_fts WHERE rowid IN (SELECT pages.id FROM pages"
+                " JOIN documents ON documents.id = pages.document_id WHERE documents.path = ?)",
+                (path,))
+            self._conn.execute(
+                "DELETE FROM pages WHERE document_id IN"
+                " (SELECT id FROM documents WHERE path = ?)", (path,))
+            self._conn.execute("DELETE FROM documents WHERE path = ?", (path,))
+
+    def search(self, query, limit=50):
+        """관련도 순서로 SearchHit 목록을 반환합니다. PDF는 다시 읽지 않습니다."""
+        match = build_query(query)
+        if not match:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT documents.path, pages.page, pages.text, bm25(pages_fts) AS score"
+                " FROM pages_fts"
+                " JOIN pages ON pages.id = pages_fts.rowid"
+                " JOIN documents ON documents.id = pages.document_id"
+                " WHERE pages_fts MATCH ?"
+                " ORDER BY score LIMIT ?", (match, limit)).fetchall()
+        return [SearchHit(path, page, self.snippet(text, query), score)
+                for path, page, text, score in rows]
+
+    def snippet(self, text, query):
+        """검색어가 처음 나오는 곳 앞뒤 텍스트. 찾지 못하면 페이지 앞부분."""
+        flat = text.replace("\n", " ")
+        runs = _RUN.findall(query.lower())
+        position = flat.lower().find(runs[0]) if runs else -1
+        if position < 0:
+            return flat[:self.SNIPPET_CHARS * 2]
+        start = max(0, position - self.SNIPPET_CHARS)
+        end = position + len(runs[0]) + self.SNIPPET_CHARS
+        return ("…" if start else "") + flat[start:end] + ("…" if end < len(flat) else "")
+
+    def page_texts(self, path):
+        """색인된 문서의 {페이지 번호: 텍스트}. 색인되지 않았으면 빈 dict."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pages.page, pages.text FROM pages"
+                " JOIN documents ON documents.id = pages.document_id"
+                " WHERE documents.path = ?", (os.path.abspath(path),)).fetchall()
+        return dict(rows)
+
+    def stats(self):
+        with self._lock:
+            documents = self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+            pages = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return documents, pages
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
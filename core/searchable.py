@@ -0,0 +1,97 @@
+"""OCR 결과를 보이지 않는 텍스트 레이어로 PDF에 써 넣어 검색 가능한 PDF를 만듭니다."""
+import logging
+import os
+import shutil
+
+import pymupdf
+
+from config import configs
+
+logger = logging.getLogger(__name__)
+
+
+class SearchablePDFWriter:
+    """원본을 복사한 PDF에 페이지별 OCR 단어를 렌더 모드 3(보이지 않음)으로 추가합니다.
+
+    flush_pages 페이지마다 증분 저장해서 변경 내용이 메모리에 쌓이지 않게 합니다.
+    손상 복구된 문서처럼 증분 저장을 할 수 없는 원본은 복사 대신 새로 저장한 파일을 기반으로 쓰고,
+    그래도 증분 저장을 할 수 없으면 close()에서 한 번에 전체를 저장합니다.
+    add_page()는 이 객체를 만든 스레드에서만 호출합니다.
+    """
+
+    def __init__(self, source_path, output_path, flush_pages=None, fontname=None):
+        self.output_path = str(output_path)
+        self.flush_pages = flush_pages or configs["searchable"]["flush_pages"]
+        self.fontname = fontname or configs["searchable"]["font"]
+        self.pages_written = 0
+        self._unsaved = 0
+
+        with pymupdf.open(source_path) as source:
+            copy = source.can_save_incrementally()
+            if not copy:
+                # 복구된 xref 등은 깨끗하게 다시 쓴 파일에서 증분 저장을 시작한다
+                logger.warning(f"증분 저장을 할 수 없는 원본이라 새로 저장해서 사용합니다: {source_path}")
+                source.save(self.output_path, garbage=1)
+        if copy:
+            shutil.copyfile(source_path, self.output_path)
+        self.doc = pymupdf.open(self.output_path)
+        self.incremental = self.doc.can_save_incrementally()
+
+    def add_page(self, result):
+        """PageResult의 단어들을 해당 페이지에 추가합니다.
+
+        단어 좌표는 페이지 회전(/Rotate)을 적용하기 전의 페이지 좌표이고, insert_text()도 같은
+        좌표계에 그립니다. 글줄이 result.text_angle만큼 돌아가 있으면 단어 상자를 글줄이 가로인
+        좌표로 돌려 크기를 재고, 글자도 그만큼 돌려 넣습니다.
+        """
+        if not result.words:
+            return
+
+        page = self.doc[result.page - 1]
+        angle = pymupdf.Matrix(result.text_angle)
+        upright = ~angle
+        for x0, y0, x1, y1, text in result.words:
+            rect = pymupdf.Rect(x0, y0, x1, y1) * upright
+            if rect.is_empty or not text.strip():
+                continue
+            fontsize = rect.height
+            # insert_text()가 PDF에 기록하는 글자 폭으로 잰다 (korea 등 CJK 기본 글꼴은 모든 글자가 1em)
+            text_width = pymupdf.get_text_length(text, fontname=self.fontname, fontsize=fontsize)
+            if text_width <= 0:
+                continue
+            # 글자 폭이 단어 상자 폭과 같아지도록 글줄 방향으로만 늘이거나 줄인 뒤 글줄 방향으로 돌린다.
+            # morph는 PDF 좌표(y축 위쪽)에서 적용되므로 회전 방향이 반대
+            origin = pymupdf.Point(rect.x0, rect.y1 - fontsize * 0.2) * angle
+            morph = (origin, pymupdf.Matrix(rect.width / text_width, 1)
+                     * pymupdf.Matrix(-result.text_angle))
+            page.insert_text(origin, text, fontsize=fontsize, fontname=self.fontname,
+                             render_mode=3, morph=morph)
+
+        self.pages_written += 1
+        self._unsaved += 1
+        if self._unsaved >= self.flush_pages:
+            self.flush()
+
+    def flush(self):
+        if self._unsaved and self.incremental:
+            self.doc.saveIncr()
+            self._unsaved = 0
+            # 같은 Document로 증분 저장을 거듭하면 xref가 어긋난 파일이 되므로 다시 연다
+            self.doc.close()
+            self.doc = pymupdf.open(self.output_path)
+
+    def close(self):
+        try:
+            if self.incremental:
+                if self._unsaved:
+                    self.doc.saveIncr()
+            elif self._unsaved:
+                # 증분 저장을 할 수 없으면 옆에 전체를 저장한 뒤 바꿔치기
+                temp = f"{self.output_path}.tmp"
+                self.doc.save(temp, garbage=1)
+                self.doc.close()
+                os.replace(temp, self.output_path)
+        finally:
+            if not self.doc.is_closed:
+                self.doc.close()
+        logger.info(f"검색 가능한 PDF 저장: {self.output_path} ({self.pages_written} 페이지)")
@@ -0,0 +1,105 @@
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+import json
+import logging
+import threading
+import time
+
+from config import configs, DATA_DIR
+
+LOG_DIR = DATA_DIR / "logs"
+
+
+def configure_logging():
+    """애플리케이션 로그를 파일로 남깁니다. --windowed 빌드에서는 stdout이 없기 때문입니다."""
+    path = Path(configs["telemetry"]["log_path"] or LOG_DIR / "app.log")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(configs["telemetry"]["log_level"])
+
+
+@dataclass
+class PageEvent:
+    """페이지 하나의 OCR 처리 기록. JSON lines 한 줄이 됩니다."""
+    job: str  # PDF 파일 경로
+    page: int
+    started: float  # epoch 초
+    finished: float
+    source: str  # ocr / text / blank / duplicate
+    stages: dict = field(default_factory=dict)  # 단계별 소요 시간(초)
+    image_bytes: int = 0
+    cache_hit: bool = False
+    chars: int = 0
+    lang: str = ""  # 사용한 Tesseract 언어 (페이지별 감지 결과)
+    error: str = ""
+
+    @property
+    def duration(self):
+        return self.finished - self.started
+
+    @classmethod
+    def from_result(cls, job, result, error=""):
+        return cls(job=str(job), page=result.page, started=result.started,
+                   finished=result.finished, source=result.source,
+                   stages={k: round(v, 6) for k, v in result.timings.items()},
+                   image_bytes=result.image_bytes, cache_hit=result.cache_hit,
+                   chars=len(result.text), lang=result.lang, error=error)
+
+    def to_json(self):
+        return json.dumps(asdict(self), ensure_ascii=False)
+
+
+class TelemetryLog:
+    """PageEvent를 JSON lines 파일에 추가합니다. 여러 스레드에서 호출해도 됩니다."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or configs["telemetry"]["events_path"] or LOG_DIR / "ocr-events.jsonl")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, event: PageEvent):
+        with self._lock:
+            self._file.write(event.to_json() + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class ThroughputMeter:
+    """최근 페이지 완료 시각으로 pages/s와 남은 시간을 추정합니다."""
+
+    def __init__(self, total_pages: int, window: int = 20):
+        self.total_pages = total_pages
+        self.done = 0
+        self.started = time.time()
+        self._finished = deque(maxlen=window)
+
+    def update(self, event: PageEvent):
+        self.done += 1
+        self._finished.append(event.finished or time.time())
+
+    @property
+    def pages_per_sec(self):
+        if len(self._finished) >= 2 and self._finished[-1] > self._finished[0]:
+            return (len(self._finished) - 1) / (self._finished[-1] - self._finished[0])
+        elapsed = time.time() - self.started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self):
+        rate = self.pages_per_sec
+        if rate <= 0:
+            return None
+        return max(self.total_pages - self.done, 0) / rate
+
+    def message(self):
+        eta = self.eta_seconds
+        eta_text = "--:--" if eta is None else f"{int(eta) // 60:02d}:{int(eta) % 60:02d}"
+        return f"{self.pages_per_sec:.2f} pages/s, 남은 시간 {eta_text}"
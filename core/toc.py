@@ -0,0 +1,161 @@
+"""OCR 한 목차(TOC) 줄로 아웃라인을 만듭니다.
+
+"제3장서론……57", "1.2배경....12", "Chapter3Introduction 57" 같은 줄에서 제목, 계층, 인쇄된
+쪽 번호를 읽고, OCR 한 페이지의 머리글/바닥글 쪽 번호로 인쇄 쪽 번호와 실제 페이지의
+차이(offset)를 찾아 실제 페이지로 바꿉니다. 모든 단계가 줄/페이지 수에 비례합니다.
+"""
+from collections import Counter
+from dataclasses import dataclass
+import re
+
+PAGE_MARKER = re.compile(r"^=== Page (\d+) ===$")
+
+# 제목과 쪽 번호 사이의 점선(리더)
+_LEADER = r"[.·…‥•∙_\-–—\s]"
+_ENTRY = re.compile(rf"^(?P<title>.*?\D)(?:{_LEADER}{{2,}}|\s+)?(?P<page>\d{{1,4}})$")
+_ENTRY_LEADER_ONLY = re.compile(rf"^(?P<title>.+?){_LEADER}{{2,}}(?P<page>\d{{1,4}})$")
+# 앞부분(머리말 등)의 로마 숫자 쪽 번호는 실제 페이지를 알 수 없으므로 버린다
+_ROMAN_PAGE = re.compile(rf"^(?P<title>.+?){_LEADER}{{2,}}[ivxlc]{{1,7}}$", re.IGNORECASE)
+_DECIMAL = re.compile(r"^(\d{1,3}(?:\.\d{1,3})*)\.?(?=\D)")
+
+# 번호 형식 → 계층 순위 (작을수록 상위)
+_RANKS = [
+    (re.compile(r"^(제\d+[편부]|part\d*|[ivx]+부)", re.IGNORECASE), 0),
+    (re.compile(r"^(제\d+장|chapter\d*|ch\.\d+)", re.IGNORECASE), 1),
+    (re.compile(r"^(제\d+절|section\d*|§)", re.IGNORECASE), 2),
+    (re.compile(r"^(제\d+항)"), 3),
+]
+
+# 머리글/바닥글의 쪽 번호: "57", "- 57 -", "57|제3장", "제3장|57"
+_FOLIO = re.compile(r"^[\-–—|\s]*(\d{1,4})[\-–—|\s]*$")
+_FOLIO_EDGE = re.compile(r"^(\d{1,4})\D|\D(\d{1,4})$")
+
+
+@dataclass
+class TOCEntry:
+    title: str
+    rank: int
+    printed_page: int = None  # 목차에 인쇄된 쪽 번호 (없으면 None)
+
+
+def _numbering_only(title):
+    """title이 "Chapter", "Part", "1.", "제"처럼 번호 부분뿐이면 True."""
+    rest = title.strip()
+    for pattern, _ in _RANKS:
+        match = pattern.match(rest)
+        if match:
+            rest = rest[match.end():]
+            break
+    else:
+        # _DECIMAL은 번호 뒤에 글자가 있어야 맞으므로 공백을 붙여 본다
+        decimal = _DECIMAL.match(rest + " ")
+        if decimal:
+            rest = rest[decimal.end():]
+    rest = rest.strip(".·…‥•∙_-–— ")
+    return not rest or rest == "제"
+
+
+def parse_toc_line(line):
+    """목차 한 줄을 TOCEntry로 바꿉니다. 제목이 없으면 None.
+
+    리더(점선) 없이 번호만 있는 줄("Chapter3", "Part1", "1.2")은 번호의 숫자를 쪽 번호로
+    읽지 않도록 None을 반환합니다.
+    """
+    line = line.strip()
+    if not line or PAGE_MARKER.match(line):
+        return None
+
+    title, printed_page = line, None
+    leader = _ENTRY_LEADER_ONLY.match(line)
+    match = leader or _ENTRY.match(line)
+    if match and not leader and _numbering_only(match["title"]):
+        return None
+    if match:
+        title, printed_page = match["title"], int(match["page"])
+    elif roman := _ROMAN_PAGE.match(line):
+        title = roman["title"]
+    title = title.rstrip(".·…‥•∙_-–— ").strip()
+    if not title:
+        return None
+    return TOCEntry(title, _rank(title), printed_page)
+
+
+def _rank(title):
+    for pattern, rank in _RANKS:
+        if pattern.match(title):
+            return rank
+    decimal = _DECIMAL.match(title + " ")
+    if decimal:
+        # 1 → 장, 1.2 → 절, 1.2.3 → 항
+        return decimal[1].count(".") + 1
+    # 번호가 없는 항목(머리말, 찾아보기 등)은 장과 같은 수준
+    return 1
+
+
+def split_pages(text):
+    """'=== Page N ===' 구분이 있는 OCR 출력을 {페이지 번호: 텍스트}로 나눕니다."""
+    pages = {}
+    page, lines = None, []
+    for line in text.splitlines():
+        marker = PAGE_MARKER.match(line.strip())
+        if marker:
+            if page is not None:
+                pages[page] = "\n".join(lines)
+            page, lines = int(marker[1]), []
+        elif page is not None:
+            lines.append(line)
+    if page is not None:
+        pages[page] = "\n".join(lines)
+    return pages
+
+
+def _folio(line):
+    line = line.strip()
+    match = _FOLIO.match(line)
+    if match:
+        return int(match[1])
+    # 짧은 머리글 줄의 맨 앞/뒤 숫자 ("57제3장서론", "제3장서론57")
+    if len(line) <= 40:
+        match = _FOLIO_EDGE.search(line)
+        if match:
+            return int(match[1] or match[2])
+    return None
+
+
+def detect_page_offset(page_texts, edge_lines=2, min_votes=2):
+    """머리글/바닥글 쪽 번호로 (실제 페이지 - 인쇄 쪽 번호)를 찾습니다. 근거가 부족하면 0."""
+    votes = Counter()
+    for page, text in page_texts.items():
+        lines = [line for line in text.splitlines() if line.strip()]
+        if not lines:
+            continue
+        candidates = {_folio(line) for line in lines[:edge_lines] + lines[-edge_lines:]}
+        # 한 페이지는 같은 offset에 한 표만
+        for offset in {page - printed for printed in candidates if printed}:
+            votes[offset] += 1
+    if not votes:
+        return 0
+    offset, count = votes.most_common(1)[0]
+    return offset if count >= min_votes else 0
+
+
+def build_outline(lines, page_count, page_texts=None, offset=None):
+    """목차 줄로 [level, title, page] 아웃라인을 만듭니다. (아웃라인, 사용한 offset)을 반환합니다.
+
+    쪽 번호가 없는 항목(부 제목 등)은 다음 항목의 페이지를 가리킵니다.
+    """
+    entries = [entry for entry in map(parse_toc_line, lines) if entry is not None]
+    if offset is None:
+        offset = detect_page_offset(page_texts or {})
+
+    top_rank = min((entry.rank for entry in entries), default=0)
+    toc = []
+    next_page = page_count
+    # 뒤에서부터 채워서 쪽 번호 없는 항목에 다음 항목의 페이지를 한 번에 넘긴다
+    for entry in reversed(entries):
+        if entry.printed_page is not None:
+            next_page = entry.printed_page + offset
+        page = min(max(next_page, 1), page_count)
+        toc.append([entry.rank - top_rank + 1, entry.title, page])
+    toc.reverse()
+    return toc, offset
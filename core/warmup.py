@@ -0,0 +1,38 @@
+"""앱 시작 후 무거운 모듈을 백그라운드에서 미리 불러옵니다.
+
+pymupdf, pypdf, pytesseract, PIL, numpy는 처음 사용하는 곳에서 불러오도록 되어 있어 창이
+빨리 뜹니다. 창이 뜬 뒤 이 모듈들을 데몬 스레드에서 미리 불러 두면 첫 PDF 열기나 OCR도 기다리지 않습니다.
+같은 모듈을 UI 스레드가 동시에 불러오면 import 잠금으로 먼저 시작한 쪽이 끝날 때까지 기다립니다.
+"""
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 처음 문서를 열 때 필요한 순서대로
+HEAVY_MODULES = (
+    "pymupdf",
+    "core.ocr",  # PIL, pytesseract, numpy(전처리)
+    "core.workers",
+    "pypdf",
+)
+
+
+def _import_all(modules):
+    started = time.perf_counter()
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # 선택 기능의 모듈이 없어도 앱은 계속 동작 (실제로 쓸 때 오류를 보여 줌)
+            logger.exception(f"모듈 미리 불러오기 실패: {name}")
+    logger.info(f"모듈 미리 불러오기 완료: {time.perf_counter() - started:.2f}s")
+
+
+def warm_up(modules=HEAVY_MODULES):
+    """modules를 데몬 스레드에서 불러옵니다. 시작한 스레드를 반환합니다."""
+    thread = threading.Thread(target=_import_all, args=(modules,), name="warm-up", daemon=True)
+    thread.start()
+    return thread
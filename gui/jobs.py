@@ -0,0 +1,90 @@
+import os
+
+from PyQt6.QtWidgets import (QGroupBox, QVBoxLayout, QHBoxLayout, QPushButton,
+                             QTableWidget, QTableWidgetItem, QProgressBar, QHeaderView,
+                             QAbstractItemView, QFileDialog)
+from PyQt6.QtCore import pyqtSignal
+
+from core.jobs import OCRQueue
+
+
+class JobQueuePanel(QGroupBox):
+    """여러 PDF의 OCR 작업 대기열. 작업마다 진행률/상태를 보여 주고 일시 정지/취소할 수 있습니다."""
+    job_updated = pyqtSignal(object)  # 작업 스레드 → UI 스레드
+
+    COLUMNS = ["File", "Pages", "Progress", "State"]
+
+    def __init__(self, parent=None):
+        super().__init__("OCR Queue", parent)
+        self.queue = OCRQueue(on_update=self.job_updated.emit)
+        # "Add files..."로 추가하는 작업에 쓸 경로. 마지막으로 추가한 작업의 경로를 따른다
+        self.tesseract_path = None
+        self._rows = {}  # job.id → 행 번호
+        self.job_updated.connect(self._update_row)
+
+        layout = QVBoxLayout()
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        self.add_files_btn = QPushButton("Add files...")
+        self.add_files_btn.clicked.connect(self._browse_files)
+        button_layout.addWidget(self.add_files_btn)
+        for label, slot in (("Pause", self.queue.pause), ("Resume", self.queue.resume),
+                            ("Cancel", self.queue.cancel)):
+            button = QPushButton(label)
+            button.clicked.connect(lambda _, slot=slot: self._apply_to_selected(slot))
+            button_layout.addWidget(button)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def add_job(self, filename, first_page=1, last_page=None, tesseract_path=None,
+                searchable_output=None):
+        self.tesseract_path = tesseract_path
+        return self.queue.add(filename, first_page, last_page, searchable_output=searchable_output,
+                              tesseract_path=tesseract_path)
+
+    def _browse_files(self):
+        filenames, _ = QFileDialog.getOpenFileNames(
+            self, "Add PDFs to OCR queue", "", "PDF files (*.pdf);;All files (*.*)")
+        for filename in filenames:
+            self.add_job(filename, tesseract_path=self.tesseract_path)
+
+    def _selected_jobs(self):
+        rows = {index.row() for index in self.table.selectionModel().selectedRows()}
+        return [job for job in self.queue.jobs if self._rows.get(job.id) in rows]
+
+    def _apply_to_selected(self, action):
+        for job in self._selected_jobs():
+            action(job)
+
+    def _update_row(self, job):
+        row = self._rows.get(job.id)
+        if row is None:
+            row = self.table.rowCount()
+            self._rows[job.id] = row
+            self.table.insertRow(row)
+            name = QTableWidgetItem(os.path.basename(job.filename))
+            name.setToolTip(job.filename)
+            self.table.setItem(row, 0, name)
+            self.table.setItem(row, 1, QTableWidgetItem(f"{job.first_page}-{job.last_page}"))
+            progress = QProgressBar()
+            progress.setRange(0, 100)
+            self.table.setCellWidget(row, 2, progress)
+            self.table.setItem(row, 3, QTableWidgetItem())
+
+        self.table.cellWidget(row, 2).setValue(job.percent)
+        state = self.table.item(row, 3)
+        state.setText(job.state)
+        state.setToolTip(job.error or job.output_path)
+
+    def prioritize(self, filename):
+        self.queue.prioritize(filename)
+
+    def close_queue(self):
+        self.queue.close()
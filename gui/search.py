@@ -0,0 +1,59 @@
+import os
+
+from PyQt6.QtWidgets import (QGroupBox, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
+                             QListWidget, QListWidgetItem, QLabel)
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from core.search import SearchIndex
+
+
+class SearchPanel(QGroupBox):
+    """OCR 결과 전문 검색. 결과를 선택하면 hit_selected(경로, 페이지)를 보냅니다."""
+    hit_selected = pyqtSignal(str, int)  # 페이지는 1부터 시작
+
+    def __init__(self, parent=None):
+        super().__init__("Search OCR text", parent)
+        self.index = None
+
+        layout = QVBoxLayout()
+        input_layout = QHBoxLayout()
+        self.query_entry = QLineEdit()
+        self.query_entry.returnPressed.connect(self.search)
+        input_layout.addWidget(self.query_entry)
+        search_btn = QPushButton("Search")
+        search_btn.clicked.connect(self.search)
+        input_layout.addWidget(search_btn)
+        layout.addLayout(input_layout)
+
+        self.result_label = QLabel()
+        layout.addWidget(self.result_label)
+        self.results = QListWidget()
+        self.results.itemActivated.connect(self._on_activated)
+        self.results.itemClicked.connect(self._on_activated)
+        layout.addWidget(self.results)
+        self.setLayout(layout)
+
+    def search(self):
+        query = self.query_entry.text().strip()
+        self.results.clear()
+        if not query:
+            return
+        if self.index is None:
+            # 처음 검색할 때 연다 (OCR 스레드가 색인을 갱신해도 WAL이라 바로 보임)
+            self.index = SearchIndex()
+        hits = self.index.search(query)
+        for hit in hits:
+            item = QListWidgetItem(f"{os.path.basename(hit.path)} p.{hit.page}: {hit.snippet}")
+            item.setToolTip(hit.path)
+            item.setData(Qt.ItemDataRole.UserRole, (hit.path, hit.page))
+            self.results.addItem(item)
+        self.result_label.setText(f"{len(hits)} results")
+
+    def _on_activated(self, item):
+        path, page = item.data(Qt.ItemDataRole.UserRole)
+        self.hit_selected.emit(path, page)
+
+    def close_index(self):
+        if self.index is not None:
+            self.index.close()
+            self.index = None
@@ -3,4 +3,5 @@ from PyQt6.QtCore import QObject, pyqtSignal
 class TextUpdateSignals(QObject):
     update_text = pyqtSignal(str)
     update_message = pyqtSignal(str)
-    clear_text = pyqtSignal() 
\ No newline at end of file
+    clear_text = pyqtSignal()
+    profile_ready = pyqtSignal(object)  # core.profile.DocumentProfile
@@ -0,0 +1,120 @@
+from PyQt6.QtWidgets import QListWidget, QListWidgetItem, QListView
+from PyQt6.QtGui import QIcon, QImage, QPixmap
+from PyQt6.QtCore import QSize, QTimer, pyqtSignal
+
+from config import configs
+from core.render import PageRenderer
+
+
+class ThumbnailSidebar(QListWidget):
+    """페이지 썸네일 목록.
+
+    보이는 항목과 현재 페이지 앞뒤만 백그라운드에서 렌더링하고, 화면에서 멀어진 항목의
+    아이콘은 버립니다. 렌더링 결과는 PageRenderer의 LRU 캐시에 남아 있어 다시 돌아오면 바로 표시됩니다.
+    """
+    page_selected = pyqtSignal(int)  # 0부터 시작하는 페이지 번호
+    _rendered = pyqtSignal(object)  # 렌더 스레드 → UI 스레드
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thumb_width = configs["thumbnails"]["width"]
+        self.renderer = None
+        self.zoom = 1.0
+        self._icon_rows = set()
+        self._generation = 0  # 문서를 새로 열 때마다 증가 (이전 문서의 늦은 렌더링 결과 무시)
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.TopToBottom)
+        self.setWrapping(False)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(4)
+        self.setFixedWidth(self.thumb_width + 40)
+
+        self._rendered.connect(self._on_rendered_signal)
+        self.currentRowChanged.connect(self._on_row_changed)
+
+        # 스크롤 중에는 요청을 모았다가 멈췄을 때 한 번만 처리
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(50)
+        self._scroll_timer.timeout.connect(self._update_visible)
+        self.verticalScrollBar().valueChanged.connect(self._scroll_timer.start)
+
+    def load(self, filename):
+        self.close_document()
+        self._generation += 1
+        generation = self._generation
+        self.renderer = PageRenderer(
+            filename, on_rendered=lambda rendered: self._rendered.emit((generation, rendered)))
+        width, height = self.renderer.first_page_size
+        self.zoom = self.thumb_width / width if width else 1.0
+        self.setIconSize(QSize(self.thumb_width, round(height * self.zoom)))
+
+        self.blockSignals(True)
+        for page in range(self.renderer.page_count):
+            self.addItem(QListWidgetItem(str(page + 1)))
+        self.blockSignals(False)
+        self.set_current_page(0)
+
+    def close_document(self):
+        if self.renderer is not None:
+            self.renderer.close()
+            self.renderer = None
+        self._icon_rows.clear()
+        self.clear()
+
+    def set_current_page(self, page):
+        """뷰어의 현재 페이지를 선택하고 앞뒤 페이지를 미리 렌더링합니다."""
+        if self.renderer is None or not 0 <= page < self.count():
+            return
+        self.blockSignals(True)
+        self.setCurrentRow(page)
+        self.blockSignals(False)
+        self.scrollToItem(self.item(page))
+        for rendered in self.renderer.prefetch(page, self.zoom):
+            self._on_rendered(rendered)
+        self._update_visible()
+
+    def _visible_rows(self):
+        viewport = self.viewport().rect()
+        top = self.indexAt(viewport.topLeft())
+        bottom = self.indexAt(viewport.bottomLeft())
+        first = top.row() if top.isValid() else 0
+        last = bottom.row() if bottom.isValid() else min(first + 20, self.count() - 1)
+        return first, last
+
+    def _update_visible(self):
+        if self.renderer is None or not self.count():
+            return
+        first, last = self._visible_rows()
+        for page in range(first, last + 1):
+            rendered = self.renderer.request(page, self.zoom)
+            if rendered is not None:
+                self._on_rendered(rendered)
+
+        # 화면에서 멀리 떨어진 항목의 아이콘은 버려서 메모리를 일정하게 유지
+        margin = configs["thumbnails"]["prefetch_pages"] * 2
+        current = self.currentRow()
+        for row in list(self._icon_rows):
+            if not (first - margin <= row <= last + margin or abs(row - current) <= margin):
+                self.item(row).setIcon(QIcon())
+                self._icon_rows.discard(row)
+
+    def _on_rendered_signal(self, message):
+        generation, rendered = message
+        if generation == self._generation:
+            self._on_rendered(rendered)
+
+    def _on_rendered(self, rendered):
+        if self.renderer is None or rendered.zoom != round(self.zoom, 4) \
+                or rendered.page >= self.count():
+            return
+        image = QImage(rendered.samples, rendered.width, rendered.height,
+                       rendered.width * 3, QImage.Format.Format_RGB888)
+        self.item(rendered.page).setIcon(QIcon(QPixmap.fromImage(image)))
+        self._icon_rows.add(rendered.page)
+
+    def _on_row_changed(self, row):
+        if row >= 0:
+            self.page_selected.emit(row)
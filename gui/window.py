@@ -1,21 +1,33 @@
 from pathlib import Path
+import os
+import threading
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                           QTextEdit, QFileDialog, QGroupBox, QSplitter,
-                           QStatusBar, QProgressBar)
+                           QPlainTextEdit, QFileDialog, QGroupBox, QSplitter,
+                           QStatusBar, QProgressBar, QCheckBox, QInputDialog)
 from PyQt6.QtGui import QIntValidator, QIcon
 from PyQt6.QtPdfWidgets import QPdfView
 from PyQt6.QtPdf import QPdfDocument
-from PyQt6.QtCore import QObject, Qt, QTimer
-from pypdf import PdfReader, PdfWriter
-from pytesseract import pytesseract
-import pymupdf
-import os
+from PyQt6.QtCore import QObject, Qt, QTimer, QPointF
+import logging
 
 from config import configs
 from utils.pdf import open_pdf
 from .signals import TextUpdateSignals
-from core import OCRWorker
+from .thumbnails import ThumbnailSidebar
+from .jobs import JobQueuePanel
+from .search import SearchPanel
+from core.checkpoint import OCRJournal
+from core.languages import language_signature
+from core.documents import documents
+from core.telemetry import ThroughputMeter
+from core.outline import write_toc, copy_outline, unique_output_path
+from core.profile import AnalysisTask
+from core.pages import split_pdf, extract_pages, merge_pdfs, parse_ranges
+from core.search import SearchIndex
+from core.toc import build_outline, split_pages
+
+logger = logging.getLogger(__name__)
 
 class App(QMainWindow):
     def __init__(self):
@@ -63,30 +75,45 @@ class App(QMainWindow):
         self.pdf_view.setZoomMode(QPdfView.ZoomMode.FitInView)  # 전체 페이지가 보이도록
         self.pdf_view.setPageSpacing(10)  # 페이지 간 간격
         
+        # 페이지 썸네일 (백그라운드 렌더링, 현재 페이지 앞뒤 미리 렌더링)
+        self.thumbnails = ThumbnailSidebar(self)
+        self.thumbnails.page_selected.connect(self.go_to_page)
+
         # 페이지 변경 시그널 연결
         self.pdf_view.pageNavigator().currentPageChanged.connect(self.update_page_info)
+        self.pdf_view.pageNavigator().currentPageChanged.connect(self.thumbnails.set_current_page)
         
         # 스플리터 추가
         splitter = QSplitter()
         splitter.addWidget(control_panel)
+        splitter.addWidget(self.thumbnails)
         splitter.addWidget(self.pdf_view)
-        splitter.setStretchFactor(1, 1)  # PDF 뷰어가 더 많은 공간을 차지하도록
+        splitter.setStretchFactor(2, 1)  # PDF 뷰어가 더 많은 공간을 차지하도록
         
         main_layout.addWidget(splitter)
         
         # 시그널 초기화는 위젯 생성 후에 수행
         self.signals = TextUpdateSignals()
-        self.signals.update_text.connect(self.text_widget.append)
+        self.signals.update_text.connect(self.text_widget.appendPlainText)
         self.signals.update_message.connect(self.message_label.setText)
         self.signals.clear_text.connect(self.text_widget.clear)
+        self.signals.profile_ready.connect(self.apply_profile)
         
         self.worker = None
+        # 열린 문서의 백그라운드 분석 (core.profile)
+        self.analysis = None
+        self.profile = None
 
         # 프로그레스바 추가
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.statusBar.addPermanentWidget(self.progress_bar)
 
+        # OCR 처리 속도/남은 시간
+        self.throughput_label = QLabel()
+        self.statusBar.addPermanentWidget(self.throughput_label)
+        self.throughput = None
+
     def _create_widgets(self, main_layout):
         # Tesseract 설정 영역
         self._create_tesseract_settings(main_layout)
@@ -120,39 +147,149 @@ class App(QMainWindow):
         self.stop_btn.setEnabled(False)  # 초기에는 비활성화
         ocr_layout.addWidget(self.stop_btn)
 
+        # Resume 버튼 (중단된 작업의 체크포인트가 있을 때만 활성화)
+        self.resume_btn = QPushButton("Resume")
+        self.resume_btn.clicked.connect(lambda: self.start_read_thread(resume=True))
+        self.resume_btn.setEnabled(False)
+        ocr_layout.addWidget(self.resume_btn)
+
+        # 현재 문서/페이지 범위를 OCR 대기열에 추가
+        queue_btn = QPushButton("Add to queue")
+        queue_btn.clicked.connect(self.add_to_queue)
+        ocr_layout.addWidget(queue_btn)
+
         main_layout.addLayout(ocr_layout)
 
+        # 검색 가능한 PDF 저장 여부 (OCR과 같은 패스에서 텍스트 레이어를 써 넣음)
+        self.searchable_check = QCheckBox("Save searchable PDF")
+        main_layout.addWidget(self.searchable_check)
+
         # 버튼들
         self._create_buttons(main_layout)
 
         # 텍스트 영역
         self._create_text_area(main_layout)
 
+        # OCR 결과 전문 검색
+        self.search_panel = SearchPanel(self)
+        self.search_panel.hit_selected.connect(self.open_search_hit)
+        main_layout.addWidget(self.search_panel)
+
+        # 여러 문서 OCR 대기열 (대화형 OCR과 같은 스레드 풀 사용)
+        self.job_panel = JobQueuePanel(self)
+        main_layout.addWidget(self.job_panel)
+
     def update_page_info(self, current_page):
         total_pages = self.pdf_document.pageCount()
         self.page_label.setText(f"Page {current_page + 1} of {total_pages}")
 
+    def go_to_page(self, page):
+        """뷰어를 page(0부터 시작) 페이지로 이동합니다."""
+        navigator = self.pdf_view.pageNavigator()
+        if page != navigator.currentPage():
+            navigator.jump(page, QPointF(), navigator.currentZoom())
+
+    def closeEvent(self, event):
+        self.job_panel.close_queue()
+        self.search_panel.close_index()
+        if self.analysis is not None:
+            self.analysis.cancel()
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.stop()
+            self.worker.wait()
+        self.thumbnails.close_document()
+        documents.close_all()
+        super().closeEvent(event)
+
     def open_pdf(self):
         filename, _ = QFileDialog.getOpenFileName(
             self, "Open PDF", "", "PDF files (*.pdf);;All files (*.*)")
         
         if filename:
-            self.original_filename = filename
-            self.pdf_document.load(filename)
-            total_pages = self.pdf_document.pageCount()
-            self.page_info_label.setText(f"Total pages: {total_pages}")
-            
-            # 페이지 입력 필드의 validator 업데이트
-            validator = QIntValidator(1, total_pages)
-            self.first_page_entry.setValidator(validator)
-            self.last_page_entry.setValidator(validator)
-            
-            # 기본값 설정
-            self.first_page_entry.setText("1")
-            self.last_page_entry.setText(str(total_pages))
-            
-            # 페이지 정보 초기화
-            self.update_page_info(0)
+            self.load_pdf(filename)
+
+    def load_pdf(self, filename):
+        self.original_filename = filename
+        self.pdf_document.load(filename)
+        self.thumbnails.load(filename)
+        # 보고 있는 문서의 대기열 작업을 먼저 처리
+        self.job_panel.prioritize(filename)
+        total_pages = self.pdf_document.pageCount()
+        self.page_info_label.setText(f"Total pages: {total_pages}")
+        
+        # 페이지 입력 필드의 validator 업데이트
+        validator = QIntValidator(1, total_pages)
+        self.first_page_entry.setValidator(validator)
+        self.last_page_entry.setValidator(validator)
+        
+        # 기본값 설정
+        self.first_page_entry.setText("1")
+        self.last_page_entry.setText(str(total_pages))
+        
+        # 페이지 정보 초기화
+        self.update_page_info(0)
+
+        self._update_resume_button()
+        self.start_analysis(filename)
+
+    def start_analysis(self, filename):
+        """열린 문서를 백그라운드에서 분석합니다. 이전 문서의 분석은 취소합니다."""
+        if self.analysis is not None:
+            self.analysis.cancel()
+        self.profile = None
+        self.analysis = AnalysisTask(filename, on_done=self.signals.profile_ready.emit).start()
+
+    def apply_profile(self, profile):
+        """분석 결과로 페이지 정보를 보여 주고 OCR 할 페이지 범위를 미리 채웁니다.
+
+        범위는 OCR 파이프라인도 건너뛰는 텍스트 레이어 페이지만큼만 좁히고,
+        앞뒤의 빈 페이지는 빼도 된다고 알리기만 합니다.
+        """
+        if os.path.abspath(profile.path) != os.path.abspath(self.original_filename or ""):
+            return  # 분석하는 사이 다른 문서를 열었음
+        self.profile = profile
+        self.page_info_label.setText(f"Total pages: {profile.page_count}\n{profile.summary()}")
+
+        if not configs["ocr"]["skip_text_layer"]:
+            return
+        # 사용자가 범위를 바꾸지 않았을 때만 텍스트 레이어가 없는 범위로 좁힌다
+        ocr_range = profile.ocr_range()
+        untouched = (self.first_page_entry.text() == "1"
+                     and self.last_page_entry.text() == str(profile.page_count))
+        if untouched and ocr_range and ocr_range != (1, profile.page_count):
+            self.first_page_entry.setText(str(ocr_range[0]))
+            self.last_page_entry.setText(str(ocr_range[1]))
+            self._update_resume_button()
+        suggested = profile.ocr_range(skip_blank=True)
+        if ocr_range is None:
+            self.signals.update_message.emit("모든 페이지에 텍스트 레이어가 있어 OCR이 필요 없습니다.")
+        elif suggested and suggested != ocr_range:
+            self.signals.update_message.emit(
+                f"앞뒤 빈 페이지를 빼면 {suggested[0]}-{suggested[1]} 페이지만 OCR 하면 됩니다.")
+
+    def open_search_hit(self, path, page):
+        """검색 결과의 문서를 열고(이미 열려 있으면 그대로) 해당 페이지로 이동합니다."""
+        if os.path.abspath(path) != os.path.abspath(self.original_filename or ""):
+            if not os.path.exists(path):
+                self.signals.update_message.emit(f"파일을 찾을 수 없습니다: {path}")
+                return
+            self.load_pdf(path)
+        self.go_to_page(page - 1)
+
+    def _update_resume_button(self):
+        """현재 파일과 페이지 범위로 중단된 OCR 작업 기록이 있으면 Resume 버튼을 켭니다."""
+        first_page = self.first_page_entry.text()
+        last_page = self.last_page_entry.text()
+        saved_pages = 0
+        if self.original_filename and first_page and last_page and configs["checkpoint"]["enabled"]:
+            journal = OCRJournal(self.original_filename, int(first_page), int(last_page),
+                                 language_signature(configs["languages"]["default"]),
+                                 words=self.searchable_check.isChecked())
+            saved_pages = journal.completed_pages()
+        self.resume_btn.setEnabled(saved_pages > 0)
+        if saved_pages:
+            self.signals.update_message.emit(
+                f"중단된 OCR 작업이 있습니다 ({saved_pages} 페이지 완료). Resume으로 이어서 처리할 수 있습니다.")
 
     def _create_tesseract_settings(self, main_layout):
         group_box = QGroupBox("Tesseract OCR Settings")
@@ -228,17 +365,61 @@ class App(QMainWindow):
         copy_btn.clicked.connect(self.copy_outlines)
         outline_layout.addWidget(copy_btn)
 
+        # 새 파일 대신 연 PDF 끝에 아웃라인만 덧붙인다 (원본 크기와 무관하게 빠름)
+        self.outline_in_place_check = QCheckBox("Update original file")
+        self.outline_in_place_check.setToolTip(
+            "Append the outline to the opened PDF as an incremental update instead of writing a copy.\n"
+            "The original bytes are kept unchanged at the start of the file.\n"
+            "PDFs that cannot be updated incrementally (encrypted or repaired) are rewritten in full.")
+        outline_layout.addWidget(self.outline_in_place_check)
+
         main_layout.addLayout(outline_layout)
 
+        page_layout = QHBoxLayout()
+
+        # 페이지 범위 또는 최상위 아웃라인(장)마다 나누기
+        split_btn = QPushButton("Split...")
+        split_btn.clicked.connect(self.split_document)
+        page_layout.addWidget(split_btn)
+
+        # 페이지 입력 범위만 새 PDF로 저장
+        extract_btn = QPushButton("Extract pages")
+        extract_btn.clicked.connect(self.extract_page_range)
+        page_layout.addWidget(extract_btn)
+
+        # 여러 PDF를 아웃라인과 함께 이어 붙이기
+        merge_btn = QPushButton("Merge PDFs...")
+        merge_btn.clicked.connect(self.merge_documents)
+        page_layout.addWidget(merge_btn)
+
+        main_layout.addLayout(page_layout)
+
     def _create_text_area(self, main_layout):
-        self.text_widget = QTextEdit()
+        # 수 MB 결과도 다룰 수 있도록 서식 없는 QPlainTextEdit 사용
+        self.text_widget = QPlainTextEdit()
         self.text_widget.setUndoRedoEnabled(True)
         main_layout.addWidget(self.text_widget)
 
+        # OCR 결과를 페이지마다 붙이지 않고 주기적으로 모아서 붙임
+        self.text_timer = QTimer(self)
+        self.text_timer.setInterval(configs["gui"]["text_flush_ms"])
+        self.text_timer.timeout.connect(self._flush_text)
+
+    def _flush_text(self):
+        """worker 버퍼에 쌓인 텍스트를 한 번에 텍스트 영역에 추가합니다."""
+        if self.worker is None:
+            self.text_timer.stop()
+            return
+        text = self.worker.take_text()
+        if text:
+            self.signals.update_text.emit(text)
+        elif not self.worker.isRunning():
+            self.text_timer.stop()
+
     def _create_validator(self):
         return QIntValidator()
 
-    def start_read_thread(self):
+    def start_read_thread(self, resume=False):
         if not self.original_filename:
             self.signals.update_message.emit("먼저 PDF 파일을 열어주세요.")
             return
@@ -269,24 +450,47 @@ class App(QMainWindow):
         self.progress_bar.setValue(0)
         self.statusBar.showMessage("OCR 텍스트 추출 중...")
         
-        # 이전 worker가 있다면 정리
+        # 이전 worker가 있다면 정리 (terminate 대신 중단 요청 후 완료된 페이지를 기록할 때까지 대기)
         if self.worker is not None and self.worker.isRunning():
-            self.worker.terminate()
+            self.worker.stop()
             self.worker.wait()
         
-        # 새로운 worker 생성 및 시작
+        # 새로운 worker 생성 및 시작 (OCR 모듈은 보통 warm_up()이 미리 불러 둠)
+        from core.workers import OCRWorker
         tesseract_path = self.tesseract_path.text() or None
-        self.worker = OCRWorker(self.original_filename, first_page, last_page, tesseract_path)
-        self.worker.progress.connect(self.signals.update_text.emit)
+        searchable_output = None
+        if self.searchable_check.isChecked():
+            searchable_output = unique_output_path(self.original_filename, "_searchable")
+        self.worker = OCRWorker(self.original_filename, first_page, last_page, tesseract_path,
+                                searchable_output, resume, self.job_panel.queue.executor)
         self.worker.progress_percent.connect(self.progress_bar.setValue)
         self.worker.status_message.connect(self.statusBar.showMessage)
+        self.worker.page_done.connect(self.on_page_done)
         self.worker.error.connect(self.on_ocr_error)
         self.worker.finished.connect(self.on_ocr_complete)
+        self.throughput = ThroughputMeter(last_page - first_page + 1)
         self.worker.start()
+        self.text_timer.start()
 
         # 버튼 상태 변경
         self.ocr_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
+        self.resume_btn.setEnabled(False)
+
+    def add_to_queue(self):
+        """현재 문서와 페이지 범위를 OCR 대기열에 추가합니다."""
+        if not self.original_filename:
+            self.signals.update_message.emit("먼저 PDF 파일을 열어주세요.")
+            return
+        first_page = int(self.first_page_entry.text() or 1)
+        last_page = int(self.last_page_entry.text() or self.pdf_document.pageCount())
+        searchable_output = None
+        if self.searchable_check.isChecked():
+            searchable_output = unique_output_path(self.original_filename, "_searchable")
+        job = self.job_panel.add_job(self.original_filename, first_page, last_page,
+                                     self.tesseract_path.text() or None, searchable_output)
+        self.job_panel.prioritize(self.original_filename)
+        self.statusBar.showMessage(f"OCR 대기열에 추가했습니다: {job.output_path}", 3000)
 
     def stop_read_thread(self):
         if self.worker is not None and self.worker.isRunning():
@@ -296,10 +500,23 @@ class App(QMainWindow):
             # 버튼 상태 복원
             self.ocr_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
+            # 완료된 페이지는 체크포인트에 남아 있으므로 이어서 처리할 수 있음
+            self.resume_btn.setEnabled(configs["checkpoint"]["enabled"])
+
+    def on_page_done(self, event):
+        if self.throughput is not None:
+            self.throughput.update(event)
+            self.throughput_label.setText(self.throughput.message())
 
     def on_ocr_complete(self):
+        self._flush_text()
         self.progress_bar.setVisible(False)
-        self.statusBar.showMessage("OCR 텍스트 추출이 완료되었습니다.", 3000)
+        message = "OCR 텍스트 추출이 완료되었습니다."
+        if self.worker is not None:
+            message += f" ({self.worker.pipeline.stats_message()})"
+            if self.worker.pipeline.searchable_output:
+                message += f" 저장: {self.worker.pipeline.searchable_output}"
+        self.statusBar.showMessage(message, 5000)
         # 버튼 상태 복원
         self.ocr_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
@@ -310,6 +527,7 @@ class App(QMainWindow):
         # 버튼 상태 복원
         self.ocr_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
+        self.resume_btn.setEnabled(configs["checkpoint"]["enabled"])
 
     def undo(self):
         self.text_widget.undo()
@@ -323,22 +541,32 @@ class App(QMainWindow):
             return
 
         path = self.original_filename
-        pdf_reader = PdfReader(path)
-        pdf_writer = PdfWriter()
-
-        for page in pdf_reader.pages:
-            pdf_writer.add_page(page)
-
-        lines = [line.strip() for line in self.text_widget.toPlainText().split('\n')
-                if line.strip()]
+        text = self.text_widget.toPlainText()
+        lines = [line.strip() for line in text.split('\n') if line.strip()]
 
-        for line in lines:
-            pdf_writer.add_outline_item(title=line, page_number=1)
+        try:
+            # 인쇄 쪽 번호 → 실제 페이지 차이는 이미 OCR 한 페이지의 머리글/바닥글로 찾는다
+            index = SearchIndex()
+            try:
+                page_texts = index.page_texts(path)
+            finally:
+                index.close()
+            page_texts.update(split_pages(text))
+            toc, offset = build_outline(lines, self.pdf_document.pageCount(), page_texts)
+
+            if self.outline_in_place_check.isChecked():
+                output_path = path
+            else:
+                output_path = f"{path.replace('.pdf', '')}_created_outline.pdf"
+            write_toc(path, toc, output_path)
+            self.statusBar.showMessage(
+                f"아웃라인 {len(toc)}개 항목을 저장했습니다. (쪽 번호 차이 {offset:+d})", 5000)
 
-        output_path = f"{path.replace('.pdf', '')}_created_outline.pdf"
-        pdf_writer.write(output_path)
+            self._show_outline_result(output_path)
 
-        open_pdf(output_path)
+        except Exception as e:
+            self.signals.update_message.emit(f"아웃라인 생성 중 오류가 발생했습니다: {str(e)}")
+            logger.exception(f"아웃라인 생성 중 오류가 발생했습니다: {str(e)}")
 
     def copy_outlines(self):
         if not self.original_filename:
@@ -353,163 +581,107 @@ class App(QMainWindow):
             return
 
         try:
-            # PyMuPDF로 소스 PDF 열기
-            source_doc = pymupdf.open(source_filename)
-            print("\n=== PyMuPDF 문서 정보 ===")
-            print(f"총 페이지 수: {len(source_doc)}")
-            
-            # 소스 PDF의 아웃라인 읽기
-            source_pdf = PdfReader(source_filename)
-            outlines = source_pdf.outline
-            if not outlines:
+            if self.outline_in_place_check.isChecked():
+                output_path = self.original_filename
+            else:
+                output_path = unique_output_path(self.original_filename, "_copied_outline")
+            if copy_outline(source_filename, self.original_filename, output_path) is None:
                 self.signals.update_message.emit("선택한 PDF 파일에 아웃라인이 없습니다.")
-                source_doc.close()
                 return
 
-            # 대상 PDF 준비
-            target_pdf = PdfReader(self.original_filename)
-            pdf_writer = PdfWriter()
+            self.signals.update_message.emit("아웃라인이 성공적으로 복사되었습니다.")
+            
+            # 잠시 대기 후 결과 열기
+            QTimer.singleShot(100, lambda: self._show_outline_result(output_path))
 
-            # 모든 페이지 복사
-            for page in target_pdf.pages:
-                pdf_writer.add_page(page)
+        except Exception as e:
+            self.signals.update_message.emit(f"아웃라인 복사 중 오류가 발생했습니다: {str(e)}")
+            logger.exception(f"아웃라인 복사 중 오류가 발생했습니다: {str(e)}")
 
-            # 아웃라인 복사
-            self._copy_outline_items(outlines, pdf_writer, source_doc)
+    def _show_outline_result(self, output_path):
+        """원본을 고쳤으면 다시 불러오고, 새 파일이면 PDF 뷰어로 엽니다."""
+        if output_path == self.original_filename:
+            self.load_pdf(output_path)
+        else:
+            open_pdf(output_path)
 
-            # 최종 파일 경로 생성
-            output_dir = os.path.dirname(self.original_filename)
-            base_name = os.path.splitext(os.path.basename(self.original_filename))[0]
-            output_path = os.path.join(output_dir, f"{base_name}_copied_outline.pdf")
+    def _run_page_task(self, name, task, done_message, open_result=False):
+        """페이지 작업을 백그라운드 스레드에서 실행하고 진행 상황을 메시지 레이블에 표시합니다.
 
-            # 파일명 중복 확인 및 처리
-            i = 1
-            while os.path.exists(output_path):
-                output_path = os.path.join(output_dir, f"{base_name}_copied_outline_{i}.pdf")
-                i += 1
+        task(on_progress)의 반환값으로 done_message를 만들고, open_result이면 결과 파일을 엽니다.
+        """
+        def progress(done, total):
+            self.signals.update_message.emit(f"{name} 중... ({done}/{total})")
 
-            # 파일 저장
-            pdf_writer.write(output_path)
-            source_doc.close()
+        def run():
+            try:
+                result = task(progress)
+            except Exception as e:
+                self.signals.update_message.emit(f"{name} 중 오류가 발생했습니다: {str(e)}")
+                logger.exception(f"{name} 중 오류가 발생했습니다: {str(e)}")
+                return
+            self.signals.update_message.emit(done_message(result))
+            if open_result:
+                open_pdf(result)
 
-            # PDF 뷰어에서 현재 파일 닫기
-            # self.pdf_document.close()
+        self.signals.update_message.emit(f"{name} 중...")
+        # 저장 중에 앱을 닫아도 파일이 잘리지 않도록 데몬 스레드로 만들지 않는다
+        threading.Thread(target=run, name="page-task").start()
 
-            self.signals.update_message.emit("아웃라인이 성공적으로 복사되었습니다.")
-            
-            # 잠시 대기 후 새 파일 열기
-            QTimer.singleShot(100, lambda: open_pdf(output_path))
+    def split_document(self):
+        if not self.original_filename:
+            self.signals.update_message.emit("먼저 PDF 파일을 열어주세요.")
+            return
+        spec, ok = QInputDialog.getText(
+            self, "Split PDF", "Page ranges (e.g. 1-10, 11-20)\nLeave empty to split by top-level outline")
+        if not ok:
+            return
+        try:
+            ranges = parse_ranges(spec, self.pdf_document.pageCount()) if spec.strip() else None
+        except ValueError as e:
+            self.signals.update_message.emit(str(e))
+            return
 
-        except Exception as e:
-            self.signals.update_message.emit(f"아웃라인 복사 중 오류가 발생했습니다: {str(e)}")
-            print(f"아웃라인 복사 중 오류가 발생했습니다: {str(e)}")
+        path = self.original_filename
+        output_dir = os.path.splitext(path)[0] + "_split"
+        os.makedirs(output_dir, exist_ok=True)
+        self._run_page_task(
+            "PDF 나누기", lambda progress: split_pdf(path, ranges, output_dir, progress),
+            lambda outputs: f"{len(outputs)}개 파일로 나눴습니다: {output_dir}")
 
-    def _copy_outline_items(self, outlines, pdf_writer, source_doc, parent=None):
-        """재귀적으로 아웃라인 항목을 복사"""
-        if not outlines:
+    def extract_page_range(self):
+        if not self.original_filename:
+            self.signals.update_message.emit("먼저 PDF 파일을 열어주세요.")
+            return
+        first_page = int(self.first_page_entry.text() or 1)
+        last_page = int(self.last_page_entry.text() or self.pdf_document.pageCount())
+        try:
+            ranges = parse_ranges(f"{first_page}-{last_page}", self.pdf_document.pageCount())
+        except ValueError as e:
+            self.signals.update_message.emit(str(e))
             return
 
-        for item in outlines:
-            if isinstance(item, list):
-                # 하위 아웃라인이 있는 경우 재귀적으로 처리
-                self._copy_outline_items(item, pdf_writer, source_doc, current_parent)
-            else:
-                # 아웃라인 항목 추가
-                title = item.title
-                page_number = 0
-
-                # 디버깅을 위한 정보 출력
-                print(f"\n=== 아웃라인 항목: {title} ===")
-                print(f"item type: {type(item)}")
-                
-                if hasattr(item, 'page'):
-                    page_obj = item.page.get_object()
-                    print(f"page object: {page_obj}")
-                    
-                    # PyMuPDF로 페이지 번호 확인
-                    try:
-                        if hasattr(page_obj, 'indirect_reference'):
-                            page_ref = page_obj.indirect_reference
-                            page_xref = page_ref.idnum
-                            for page_num in range(len(source_doc)):
-                                if source_doc[page_num].xref == page_xref:
-                                    print(f"PyMuPDF page number: {page_num + 1}")
-                                    page_number = page_num
-                                    break
-                    except Exception as e:
-                        print(f"PyMuPDF page number error: {str(e)}")
-
-                # 현재 아웃라인 항목 추가
-                current_parent = pdf_writer.add_outline_item(
-                    title=title,
-                    page_number=page_number,
-                    parent=parent
-                )
-
-                # 하위 항목이 있는 경우 재귀적으로 처리
-                if isinstance(item, dict) and '/First' in item:
-                    self._process_child_items(item, pdf_writer, current_parent, source_doc)
-
-    def _process_child_items(self, parent_item, pdf_writer, outline_parent, source_doc):
-        """하위 아웃라인 항목을 처리"""
-        current = parent_item['/First'].get_object()
-        while current:
-            title = current.get('/Title', '')
-            page_number = 0
-
-            # 디버깅을 위한 정보 출력
-            print(f"\n=== 하위 아웃라인 항목: {title} ===")
-            print(f"current type: {type(current)}")
-
-            # 페이지 번호 추출 시도
-            try:
-                if '/D' in current:
-                    dest = current['/D']
-                    print(f"Destination object: {dest}")
-                    if isinstance(dest, list) and len(dest) > 0:
-                        page_ref = dest[0].get_object()
-                        print(f"Page object: {page_ref}")
-                        
-                        if hasattr(page_ref, 'indirect_reference'):
-                            ref = page_ref.indirect_reference
-                            page_xref = ref.idnum
-                            for page_num in range(len(source_doc)):
-                                if source_doc[page_num].xref == page_xref:
-                                    print(f"PyMuPDF page number: {page_num + 1}")
-                                    page_number = page_num
-                                    break
-                elif '/Dest' in current:
-                    dest = current['/Dest']
-                    print(f"Destination object: {dest}")
-                    if isinstance(dest, list) and len(dest) > 0:
-                        page_ref = dest[0].get_object()
-                        print(f"Page object: {page_ref}")
-                        
-                        if hasattr(page_ref, 'indirect_reference'):
-                            ref = page_ref.indirect_reference
-                            page_xref = ref.idnum
-                            for page_num in range(len(source_doc)):
-                                if source_doc[page_num].xref == page_xref:
-                                    print(f"PyMuPDF page number: {page_num + 1}")
-                                    page_number = page_num
-                                    break
-            except Exception as e:
-                print(f"Error extracting page number: {str(e)}")
-                page_number = 0
-
-            # 현재 아웃라인 항목 추가
-            current_outline = pdf_writer.add_outline_item(
-                title=title,
-                page_number=page_number,
-                parent=outline_parent
-            )
-
-            # 하위 항목이 있는 경우 재귀적으로 처리
-            if '/First' in current:
-                self._process_child_items(current, pdf_writer, current_outline, source_doc)
-
-            # 다음 형제 항목으로 이동
-            if '/Next' in current:
-                current = current['/Next'].get_object()
-            else:
-                break 
+        path = self.original_filename
+        output_path = unique_output_path(path, f"_p{first_page}-{last_page}")
+        self._run_page_task(
+            "페이지 추출", lambda progress: extract_pages(path, ranges, output_path),
+            lambda output: f"{first_page}-{last_page} 페이지를 저장했습니다: {output}",
+            open_result=True)
+
+    def merge_documents(self):
+        filenames, _ = QFileDialog.getOpenFileNames(
+            self, "Select PDFs to merge (in order)", "", "PDF files (*.pdf);;All files (*.*)")
+        if len(filenames) < 2:
+            if filenames:
+                self.signals.update_message.emit("합칠 PDF를 두 개 이상 선택하세요.")
+            return
+        output_path, _ = QFileDialog.getSaveFileName(
+            self, "Save merged PDF", os.path.join(os.path.dirname(filenames[0]), "merged.pdf"),
+            "PDF files (*.pdf)")
+        if not output_path:
+            return
+
+        self._run_page_task(
+            "PDF 합치기",
+            lambda progress: merge_pdfs(filenames, output_path, on_progress=progress),
+            lambda output: f"{len(filenames)}개 파일을 합쳤습니다: {output}", open_result=True)